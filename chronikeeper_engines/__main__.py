@@ -1,19 +1,15 @@
-from memory_engine import MemoryEngine
-from day_night_tracker import DayNightTracker
-from relationship_manager import RelationshipManager
-from summary_generator import SummaryGenerator
-from cli_debug import run_cli
-
 """
 ChroniKeeper Quick Pickup CLI
-Tests MemoryEngine, MemoryEvent, and readiness logic without LLM.
+Tests MemoryEngine, MemoryEvent, and decay/reinforce logic without LLM.
 """
 
-from datetime import datetime, timedelta
-from memory_engine import MemoryEngine, MemoryEvent
+import json
+import os
+
+from chronikeeper_engines.simulation_core import MemoryEngine, MemoryEvent
 
-# Initialize the engine (you can tweak personality_multiplier later)
-engine = MemoryEngine(personality_multiplier=1.0)
+# Initialize the engine
+engine = MemoryEngine(theme="default")
 
 print("=== ChroniKeeper Quick Pickup Test ===")
 
@@ -26,29 +22,29 @@ sample_memories = [
 
 # 2️⃣ Add them to engine
 for mem in sample_memories:
-    engine.add_memory(mem)
+    engine.add(mem)
     print(f"Added memory: {mem.event_id} — {mem.summary}")
 
 # 3️⃣ Reinforce a skill
 print("\nReinforcing 'guitar' skill...")
-engine.reinforce_by_tags(["skill:guitar"], current_time=datetime.now())
+engine.reinforce_by_tag("skill:guitar")
 
 # 4️⃣ Fast-forward time to simulate decay
-future_time = datetime.now() + timedelta(days=14)
 print("\nSimulating 14 days later...")
-for mem in engine.memories.values():
-    readiness = mem.readiness_score(personality_multiplier=engine.personality_multiplier)
-    print(f"[{mem.event_id}] {mem.summary} → readiness: {readiness:.3f}")
+engine.decay_all(days=14)
+for mem in engine.events.values():
+    print(f"[{mem.event_id}] {mem.summary} → familiarity: {mem.familiarity:.3f}")
 
 # 5️⃣ Search by tag
 print("\nSearching memories tagged with 'python':")
-matches = engine.search_by_tags(["skill:python"])
-for mem in matches:
-    print(f"→ {mem.event_id}: {mem.summary} (tags: {mem.tags})")
+for mem in engine.events.values():
+    if "skill:python" in mem.tags:
+        print(f"→ {mem.event_id}: {mem.summary} (tags: {sorted(mem.tags)})")
 
-# 6️⃣ Save state
-engine.save("debug_memory_state.json")
-print("\nMemory state saved to debug_memory_state.json")
+# 6️⃣ Save state (next to the package, not wherever we were launched from)
+DEBUG_STATE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "debug_memory_state.json")
+with open(DEBUG_STATE_PATH, "w", encoding="utf-8") as f:
+    json.dump({k: e.to_dict() for k, e in engine.events.items()}, f, indent=2)
+print(f"\nMemory state saved to {DEBUG_STATE_PATH}")
 
 print("\n=== Done ===")
-
@@ -1,17 +1,28 @@
-from memory_engine import MemoryEngine
+from chronikeeper_engines.simulation_core import CharacterStateEngine
+
+HELP = "Commands: show chars | show world | show events | exit"
+
+
+def _show_events(engine: CharacterStateEngine):
+    for e in engine.memory.events.values():
+        print(e.to_dict())
+
+
+COMMANDS = {
+    "show chars": lambda engine: print(engine.npc_manager.npcs),
+    "show world": lambda engine: print(engine.get_context_fragment()),
+    "show events": _show_events,
+}
+
 
 def run_cli():
-    engine = MemoryEngine()
+    engine = CharacterStateEngine()
     while True:
         cmd = input("ChroniKeeper> ").strip().lower()
-        if cmd == "show chars":
-            print(engine.memory["characters"])
-        elif cmd == "show world":
-            print(engine.memory["world"])
-        elif cmd == "show events":
-            for e in engine.memory["events"]:
-                print(e)
-        elif cmd == "exit":
+        if cmd == "exit":
             break
+        fn = COMMANDS.get(cmd)
+        if fn is not None:
+            fn(engine)
         else:
-            print("Commands: show chars | show world | show events | exit")
+            print(HELP)
@@ -1,5 +1,23 @@
-from .prompt_manager import PromptManager
-from .util_summary import SummaryGenerator
-from .util_language import LanguageLookup
+# submodules load on first attribute access (PEP 562): PromptManager pulls in the
+# simulation and world engines, which LanguageLookup-only callers don't need
+_EXPORTS = {
+    "PromptManager": ".prompt_manager",
+    "SummaryGenerator": ".util_summary",
+    "LanguageLookup": ".util_language",
+}
 
 __all__ = ["PromptManager", "SummaryGenerator", "LanguageLookup"]
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -20,11 +20,13 @@ class PromptManager:
         self.lang = lang
         self.summarizer = SummaryGenerator(language=lang)
         self.translator = LanguageLookup(default_lang=lang)
+        # one-slot cache: repeated prompts over an unchanged state reuse the last context
+        self._last_sig = None
+        self._last_context = None
 
     def build_context(self):
         """Generate a short prompt context summarizing the current world and character state."""
         events = getattr(self.engine, "memory_buffer", [])
-        summary = self.summarizer.generate_summary(events)
         world_state = getattr(self.world, "environment_signature", {})
 
         # Safe hour handling
@@ -34,15 +36,27 @@ class PromptManager:
         except (ValueError, TypeError):
             hour_val = 0.0
 
+        hour = f"{hour_val:05.2f}"
+        season = world_state.get("season", "unknown")
+        mood = f"{getattr(self.engine, 'current_mood', 0.5):.2f}"
+        world_type = getattr(self.world, "world_type", "general")
+        # everything the output depends on, as rendered (only the last 10 events are summarized)
+        recent = tuple(e.get("summary", "") for e in events[-10:]) if events else None
+        sig = (hour, season, mood, world_type, recent)
+        if sig == self._last_sig:
+            return self._last_context
+
+        summary = self.summarizer.generate_summary(events)
         context = (
-            f"World time: {hour_val:05.2f}h, "
-            f"Season: {world_state.get('season', 'unknown')}. "
-            f"Character mood: {getattr(self.engine, 'current_mood', 0.5):.2f}. "
+            f"World time: {hour}h, "
+            f"Season: {season}. "
+            f"Character mood: {mood}. "
             f"Recent events: {summary}"
         )
-        return self.translator.apply_contextual_slang(
-            context, getattr(self.world, "world_type", "general")
-        )
+        context = self.translator.apply_contextual_slang(context, world_type)
+        self._last_sig = sig
+        self._last_context = context
+        return context
 
     def build_instruction_prompt(self, player_input: str):
         """Generate final formatted LLM prompt from world + player + summary."""
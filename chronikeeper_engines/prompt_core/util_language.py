@@ -2,9 +2,24 @@
 # ChroniKeeper – Language Utility Module (Localization + Slang)
 # ============================================================
 
-import os, json
+import os, json, re
 from chronikeeper_engines.core_paths import DATA_ROOT
 
+# translations are memoized per (tag, from, to); summaries are free text, so keep it bounded
+CACHE_LIMIT = 4096
+
+# context keyword -> replacements; first matching keyword wins
+SLANG_MAPS = (
+    ("mystery", {"police": "coppers", "detective": "gumshoe", "criminal": "perp"}),
+    ("sci-fi", {"computer": "terminal", "robot": "drone"}),
+    ("fantasy", {"money": "gold", "police": "guards"}),
+)
+# one alternation per context, so slang is applied in a single pass over the text
+_SLANG_PATTERNS = tuple(
+    (keyword, re.compile("|".join(map(re.escape, mapping))), mapping)
+    for keyword, mapping in SLANG_MAPS
+)
+
 class LanguageLookup:
     """Handles translation, slang filtering, and context-specific phrasing."""
 
@@ -12,19 +27,28 @@ class LanguageLookup:
         self.lookup_path = lookup_path or os.path.join(DATA_ROOT, "language", "tag_map.json")
         self.default_lang = default_lang
         self.cache = {}
-        self._load()
+        # the tag map is read on first translation, not at construction
+        self._translations = None
+
+    @property
+    def translations(self):
+        if self._translations is None:
+            self._load()
+        return self._translations
 
     def _load(self):
+        self.cache.clear()
         if not os.path.exists(self.lookup_path):
             print(f"[WARN] Missing translation file: {self.lookup_path}")
-            self.translations = {}
+            self._translations = {}
             return
         try:
             with open(self.lookup_path, "r", encoding="utf-8") as f:
-                self.translations = json.load(f)
+                translations = json.load(f)
         except Exception as e:
             print("[ERROR] Failed to load translation map:", e)
-            self.translations = {}
+            translations = {}
+        self._translations = translations
 
     # --- Translation ---
     def translate_tag(self, tag: str, from_lang="en", to_lang=None):
@@ -32,7 +56,14 @@ class LanguageLookup:
         to_lang = to_lang or self.default_lang
         if from_lang == to_lang:
             return tag
-        return self.translations.get(to_lang, {}).get(tag, tag)
+        key = (tag, from_lang, to_lang)
+        hit = self.cache.get(key)
+        if hit is None:
+            hit = self.translations.get(to_lang, {}).get(tag, tag)
+            if len(self.cache) >= CACHE_LIMIT:
+                self.cache.clear()
+            self.cache[key] = hit
+        return hit
 
     # --- Slang Adaptation ---
     def apply_contextual_slang(self, text: str, context: str) -> str:
@@ -40,13 +71,8 @@ class LanguageLookup:
         Replace words based on thematic context, to avoid immersion breaks.
         Example: 'detective' → 'gumshoe' in mystery worlds.
         """
-        slang_map = {}
-        if "mystery" in context.lower():
-            slang_map.update({"police": "coppers", "detective": "gumshoe", "criminal": "perp"})
-        elif "sci-fi" in context.lower():
-            slang_map.update({"computer": "terminal", "robot": "drone"})
-        elif "fantasy" in context.lower():
-            slang_map.update({"money": "gold", "police": "guards"})
-        for k, v in slang_map.items():
-            text = text.replace(k, v)
+        context = context.lower()
+        for keyword, pattern, mapping in _SLANG_PATTERNS:
+            if keyword in context:
+                return pattern.sub(lambda m: mapping[m.group(0)], text)
         return text
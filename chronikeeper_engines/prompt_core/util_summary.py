@@ -20,8 +20,16 @@ class SummaryGenerator:
             self.translator.translate_tag(e.get("summary", ""), "en", self.language)
             for e in events[-10:]
         ]
-        combined = " ".join(key_points)
-        words = combined.split()
-        if len(words) > self.max_words:
-            combined = " ".join(words[-self.max_words:])
-        return combined.strip()
+        # count words from the newest point back; only split what the cap can keep
+        tail, count = [], 0
+        for point in reversed(key_points):
+            words = point.split()
+            tail.append(words)
+            count += len(words)
+            if count > self.max_words > 0:
+                break
+        else:
+            if count <= self.max_words:
+                return " ".join(key_points).strip()
+        words = [w for chunk in reversed(tail) for w in chunk]
+        return " ".join(words[-self.max_words:])
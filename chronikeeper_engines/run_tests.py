@@ -10,8 +10,13 @@ import traceback
 from io import StringIO
 from datetime import datetime
 
+# resolved from this file, so the launcher works from any working directory
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 TEST_DIR = "tests"
-LOG_DIR = "logs"
+TEST_PATH = os.path.join(BASE_DIR, TEST_DIR)
+LOG_DIR = os.path.join(BASE_DIR, "logs")
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
 AUTO_REFRESH = False  # toggled in runtime or via --auto
 
 
@@ -19,10 +24,10 @@ AUTO_REFRESH = False  # toggled in runtime or via --auto
 # Utility functions
 # ------------------------------------------------------------
 def list_tests():
-    if not os.path.exists(TEST_DIR):
-        print(f"[ERROR] Missing '{TEST_DIR}' directory.")
+    if not os.path.exists(TEST_PATH):
+        print(f"[ERROR] Missing '{TEST_PATH}' directory.")
         return []
-    files = [f for f in os.listdir(TEST_DIR)
+    files = [f for f in os.listdir(TEST_PATH)
              if f.startswith("test_") and f.endswith(".py")]
     return sorted(os.path.splitext(f)[0] for f in files)
 
@@ -3,6 +3,6 @@
 # (Unified after merge)
 # ============================================================
 
-from .character_state_engine import CharacterStateEngine
+from .character_state_engine import CharacterStateEngine, MemoryEngine, MemoryEvent
 
-__all__ = ["CharacterStateEngine"]
+__all__ = ["CharacterStateEngine", "MemoryEngine", "MemoryEvent"]
@@ -3,14 +3,29 @@
 # ============================================================
 
 import os
+import sys
 import json
+import atexit
+import logging
 import random
+import time
+import weakref
+from collections import defaultdict, deque
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from functools import lru_cache, partial
+from typing import Deque, Dict, Any, FrozenSet, Iterable, List, Optional, Set, Union
+
+try:
+    import orjson  # optional: much faster state save/load
+except ImportError:
+    orjson = None
 
 from chronikeeper_engines.core_paths import DATA_ROOT
 from chronikeeper_engines.simulation_core import data_loader as DataLoader
 
+_LOG = logging.getLogger(__name__)
+
 # ============================================================
 # === Utility & Base Classes =================================
 # ============================================================
@@ -19,6 +34,68 @@ def clamp(v: float, lo: float = 0.0, hi: float = 1.0) -> float:
     return max(lo, min(hi, v))
 
 
+# familiarity kept per simulated day
+DAILY_DECAY = 0.995
+
+
+def _norm_tag(tag: str) -> str:
+    return sys.intern(tag.strip().lower())
+
+
+def iso(ts: float) -> str:
+    """Render a stored unix timestamp for display."""
+    return datetime.fromtimestamp(ts).isoformat()
+
+
+def _as_ts(value: Union[float, str]) -> float:
+    # states saved before timestamps became unix floats hold ISO strings
+    return datetime.fromisoformat(value).timestamp() if isinstance(value, str) else value
+
+
+def _encode(obj):
+    # objects stored directly in the state dict serialize themselves on demand
+    if isinstance(obj, MemoryEvent):
+        return obj.to_dict()
+    if isinstance(obj, deque):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _write_json(path: str, data: Dict[str, Any], pretty: bool = False):
+    """Serialize in memory, write once to a sibling temp file, then atomically swap it in."""
+    if orjson is not None:
+        payload = orjson.dumps(data, default=_encode,
+                               option=orjson.OPT_INDENT_2 if pretty else None)
+    elif pretty:
+        payload = json.dumps(data, default=_encode, indent=2).encode("utf-8")
+    else:
+        payload = json.dumps(data, default=_encode, separators=(",", ":")).encode("utf-8")
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+
+def _read_json(path: str) -> Dict[str, Any]:
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _flush_at_exit(ref):
+    engine = ref()
+    if engine is not None:
+        engine.flush()
+
+
+@lru_cache(maxsize=256)
+def _decay_factor(days: float) -> float:
+    """Familiarity multiplier for `days` of decay (ticks reuse a handful of values)."""
+    return DAILY_DECAY ** days
+
+
 # ============================================================
 # === Relationship Manager ===================================
 # ============================================================
@@ -33,22 +110,34 @@ class RelationshipManager:
         self.theme = theme
         self.tables = DataLoader.load_relationship_tables(theme)
         self.relations: Dict[str, Dict[str, float]] = {}
+        # running total of all affinities, so averages are O(1)
+        self._affinity_sum = 0.0
+        # bumped on every change, so owners can tell whether there is anything to save
+        self.revision = 0
+
+    def restore(self, relations: Dict[str, Dict[str, float]]):
+        self.relations = relations
+        self._affinity_sum = sum(v["affinity"] for v in relations.values())
+        self.revision += 1
 
     def adjust(self, name: str, delta: float):
-        self.relations.setdefault(name, {"affinity": 0.5})
-        self.relations[name]["affinity"] = clamp(
-            self.relations[name]["affinity"] + delta, 0.0, 1.0
-        )
+        rel = self.relations.get(name)
+        if rel is None:
+            rel = self.relations[sys.intern(name)] = {"affinity": 0.5}
+            self._affinity_sum += 0.5
+        old = rel["affinity"]
+        rel["affinity"] = clamp(old + delta, 0.0, 1.0)
+        self._affinity_sum += rel["affinity"] - old
+        self.revision += 1
 
     def get_affinity(self, name: str) -> float:
         return self.relations.get(name, {}).get("affinity", 0.5)
 
+    def affinity_avg(self) -> float:
+        return self._affinity_sum / len(self.relations) if self.relations else 0.5
+
     def get_context_fragment(self) -> Dict[str, Any]:
-        avg_affinity = (
-            sum(v["affinity"] for v in self.relations.values()) / len(self.relations)
-            if self.relations else 0.5
-        )
-        return {"relationship_count": len(self.relations), "affinity_avg": avg_affinity}
+        return {"relationship_count": len(self.relations), "affinity_avg": self.affinity_avg()}
 
 
 # ============================================================
@@ -83,46 +172,143 @@ class MoodEngine:
 # ============================================================
 
 class MemoryEvent:
-    def __init__(self, event_id: str, summary: str, tags: List[str]):
+    __slots__ = ("event_id", "summary", "tags", "timestamp",
+                 "_familiarity", "_clock", "_synced_at", "_owner")
+
+    def __init__(self, event_id: str, summary: str, tags: Iterable[str],
+                 timestamp: Optional[Union[float, str]] = None):
         self.event_id = event_id
         self.summary = summary
-        self.tags = tags
-        self.timestamp = datetime.now().isoformat()
-        self.familiarity = 0.5
+        # normalized + interned: tags repeat across thousands of events
+        self.tags: FrozenSet[str] = frozenset(_norm_tag(t) for t in tags)
+        self.timestamp: float = _as_ts(timestamp) if timestamp else time.time()
+        # decay is applied lazily: the owning engine's clock (a one-item list of
+        # elapsed days) is compared against the day this value was last brought up to date
+        self._clock: List[float] = [0.0]
+        self._synced_at = 0.0
+        self._familiarity = 0.5
+        # MemoryEngine this event is stored in; told about every familiarity change
+        self._owner: Optional["MemoryEngine"] = None
+
+    @property
+    def familiarity(self) -> float:
+        pending = self._clock[0] - self._synced_at
+        if pending:
+            self._familiarity = clamp(self._familiarity * _decay_factor(pending))
+            self._synced_at = self._clock[0]
+        return self._familiarity
+
+    @familiarity.setter
+    def familiarity(self, value: float):
+        owner = self._owner
+        if owner is not None:
+            owner._familiarity_changed(value - self.familiarity)
+        self._familiarity = value
+        self._synced_at = self._clock[0]
 
     def reinforce(self, delta: float = 0.05):
         self.familiarity = clamp(self.familiarity + delta)
 
     def decay(self, days: float = 1.0):
-        self.familiarity = clamp(self.familiarity * (0.995 ** days))
+        factor = DAILY_DECAY if days == 1 else _decay_factor(days)
+        self.familiarity = clamp(self.familiarity * factor)
 
     def to_dict(self):
-        return self.__dict__
+        return {
+            "event_id": self.event_id,
+            "summary": self.summary,
+            "tags": sorted(self.tags),
+            "timestamp": self.timestamp,
+            "familiarity": self.familiarity,
+        }
 
 
 class MemoryEngine:
     def __init__(self, theme: str = "default"):
         self.theme = theme
         self.events: Dict[str, MemoryEvent] = {}
+        # tag -> event ids; kept in sync by add(), so tags must be set before adding
+        self._by_tag: Dict[str, Set[str]] = defaultdict(set)
+        # elapsed simulated days, shared by reference with every event added
+        self._clock: List[float] = [0.0]
+        # running total of familiarity as of the current clock; stored events
+        # report every change to it (see MemoryEvent.familiarity)
+        self._fam_sum = 0.0
+        # bumped on every change, so owners can tell whether there is anything to save
+        self.revision = 0
 
     def add(self, event: MemoryEvent):
+        previous = self.events.get(event.event_id)
+        if previous is not None:
+            self.discard(previous.event_id)
+        if event._owner is not None:
+            # an event lives in one engine at a time
+            event._owner.discard(event.event_id)
+        # settle against the event's old clock before it joins ours
+        familiarity = event.familiarity
+        event._clock = self._clock
+        event._synced_at = self._clock[0]
+        event._familiarity = familiarity
+        event._owner = self
+        self._fam_sum += familiarity
         self.events[event.event_id] = event
+        for t in event.tags:
+            self._by_tag[t].add(event.event_id)
+        self.revision += 1
+
+    def discard(self, event_id: str):
+        """Remove an event (no-op if absent); it keeps its familiarity as of now."""
+        event = self.events.pop(event_id, None)
+        if event is None:
+            return
+        self._unindex(event)
+        familiarity = event.familiarity
+        self._fam_sum -= familiarity
+        event._owner = None
+        event._clock = [self._clock[0]]
+        self.revision += 1
+
+    def _familiarity_changed(self, delta: float):
+        self._fam_sum += delta
+        self.revision += 1
+
+    def _unindex(self, event: MemoryEvent):
+        for t in event.tags:
+            ids = self._by_tag.get(t)
+            if ids is not None:
+                ids.discard(event.event_id)
+                if not ids:
+                    del self._by_tag[t]
 
     def reinforce_by_tag(self, tag: str, delta: float = 0.02):
-        for e in self.events.values():
-            if tag in e.tags:
-                e.reinforce(delta)
+        events = self.events
+        for eid in self._by_tag.get(_norm_tag(tag), ()):
+            events[eid].reinforce(delta)
+
+    def reinforce_by_tags(self, tags: Iterable[str], delta: float = 0.02):
+        """Reinforce every event carrying any of `tags`, once per event."""
+        by_tag = self._by_tag
+        matched: Set[str] = set()
+        for t in tags:
+            ids = by_tag.get(_norm_tag(t))
+            if ids:
+                matched |= ids
+        events = self.events
+        for eid in matched:
+            events[eid].reinforce(delta)
 
     def decay_all(self, days: float = 1.0):
-        for e in self.events.values():
-            e.decay(days)
+        # O(1): events catch up on the elapsed days the next time they are read
+        self._clock[0] += days
+        # decay never clamps (factor < 1, values >= 0), so the total scales exactly
+        self._fam_sum *= DAILY_DECAY if days == 1 else _decay_factor(days)
+        self.revision += 1
+
+    def familiarity_avg(self) -> float:
+        return self._fam_sum / len(self.events) if self.events else 0.5
 
     def get_context_fragment(self) -> Dict[str, Any]:
-        familiarity_avg = (
-            sum(e.familiarity for e in self.events.values()) / len(self.events)
-            if self.events else 0.5
-        )
-        return {"memory_count": len(self.events), "familiarity_avg": familiarity_avg}
+        return {"memory_count": len(self.events), "familiarity_avg": self.familiarity_avg()}
 
 
 # ============================================================
@@ -136,28 +322,59 @@ class NPCManager:
 
     def __init__(self):
         self.npcs: Dict[str, Dict[str, Any]] = {}
+        # running total of NPC moods, refreshed by every update pass
+        self._mood_sum = 0.0
+        # bumped on every change, so owners can tell whether there is anything to save
+        self.revision = 0
+
+    def restore(self, npcs: Dict[str, Dict[str, Any]]):
+        intern = sys.intern
+        for n in npcs.values():
+            for field in ("occupation", "shift"):
+                if isinstance(n.get(field), str):
+                    n[field] = intern(n[field])
+        self.npcs = npcs
+        self._mood_sum = sum(n["mood"] for n in npcs.values())
+        self.revision += 1
+
+    def load_roster(self, roster: Dict[str, Dict[str, Any]]):
+        """Replace the NPC set with copies of `roster`'s records (the roster itself may be shared)."""
+        self.restore({name: dict(record) for name, record in roster.items()})
 
     def register(self, name: str, occupation: str = "civilian", shift: str = "day"):
-        self.npcs[name] = {
-            "occupation": occupation,
-            "shift": shift,
+        previous = self.npcs.get(name)
+        if previous is not None:
+            self._mood_sum -= previous["mood"]
+        # names, occupations and shifts repeat across the roster: share one object each
+        self.npcs[sys.intern(name)] = {
+            "occupation": sys.intern(occupation),
+            "shift": sys.intern(shift),
             "mood": random.uniform(0.4, 0.6),
-            "last_seen": datetime.now().isoformat(),
+            "last_seen": time.time(),
         }
+        self._mood_sum += self.npcs[name]["mood"]
+        self.revision += 1
 
     def update_all(self, world_context: Dict[str, Any]):
+        comfort = world_context.get("comfort", 0.5)
+        noise = world_context.get("noise", 0.5)
+        delta = (comfort - noise) * 0.02
+        uniform = random.uniform
+        total = 0.0
         for npc in self.npcs.values():
-            comfort = world_context.get("comfort", 0.5)
-            noise = world_context.get("noise", 0.5)
-            delta = (comfort - noise) * 0.02
-            npc["mood"] = clamp(npc["mood"] + delta + random.uniform(-0.01, 0.01))
+            # same draw order as one uniform() per NPC, so seeded runs are unchanged
+            mood = npc["mood"] + delta + uniform(-0.01, 0.01)
+            mood = 0.0 if mood < 0.0 else 1.0 if mood > 1.0 else mood
+            npc["mood"] = mood
+            total += mood
+        self._mood_sum = total
+        self.revision += 1
+
+    def mood_avg(self) -> float:
+        return self._mood_sum / len(self.npcs) if self.npcs else 0.5
 
     def get_context_fragment(self) -> Dict[str, Any]:
-        avg_mood = (
-            sum(n["mood"] for n in self.npcs.values()) / len(self.npcs)
-            if self.npcs else 0.5
-        )
-        return {"npc_count": len(self.npcs), "npc_mood_avg": avg_mood}
+        return {"npc_count": len(self.npcs), "npc_mood_avg": self.mood_avg()}
 
 
 # ============================================================
@@ -169,17 +386,25 @@ class SessionMemory:
     Ephemeral memory limited to one runtime/chat session.
     """
 
+    MAX_ENTRIES = 200
+
     def __init__(self, session_id: str = "session_default"):
         self.session_id = session_id
-        self.entries: List[str] = []
+        # ring buffer: the oldest entry drops off in O(1) once full
+        self.entries: Deque[str] = deque(maxlen=self.MAX_ENTRIES)
+        # bumped on every change, so owners can tell whether there is anything to save
+        self.revision = 0
+
+    def restore(self, entries: Iterable[str]):
+        self.entries = deque(entries, maxlen=self.MAX_ENTRIES)
+        self.revision += 1
 
     def add(self, text: str):
         self.entries.append(text)
-        if len(self.entries) > 200:
-            self.entries.pop(0)
+        self.revision += 1
 
     def summarize(self, limit: int = 5) -> str:
-        return " | ".join(self.entries[-limit:])
+        return " | ".join(list(self.entries)[-limit:])
 
     def get_context_fragment(self) -> Dict[str, Any]:
         return {"session_entry_count": len(self.entries)}
@@ -195,7 +420,11 @@ class CharacterStateEngine:
     memory, NPCs, and session memory.
     """
 
-    def __init__(self, theme: str = "default", storage_path: Optional[str] = None):
+    # updates between autosaves once the session log is long enough to be worth keeping
+    AUTOSAVE_EVERY = 50
+
+    def __init__(self, theme: str = "default", storage_path: Optional[str] = None,
+                 autosave_every: Optional[int] = None, flush_at_exit: bool = False):
         self.theme = theme
         self.storage_path = storage_path or os.path.join(DATA_ROOT, "character_state.json")
 
@@ -206,7 +435,19 @@ class CharacterStateEngine:
         self.session_memory = SessionMemory()
         self.last_update = datetime.now()
 
+        # persistence bookkeeping: state revision as last written / nesting depth of batch()
+        self._saved_revision = -1
+        self._batch_depth = 0
+        self._mutations_since_save = 0
+        self._ensured_dir: Optional[str] = None
+        self.autosave_every = autosave_every or self.AUTOSAVE_EVERY
+        self._exit_hook = None
+
         self.load()
+        # freshly loaded (or empty) state matches what is on disk
+        self._saved_revision = self._state_revision()
+        if flush_at_exit:
+            self.enable_exit_flush()
 
     # --------------------------------------------------------
     # === Core update & integration ==========================
@@ -215,61 +456,113 @@ class CharacterStateEngine:
     def update_state(self, world_context: Dict[str, Any]):
         # --- Update environment effects ---
         comfort = world_context.get("comfort", 0.5)
-        social_affinity = self.relationships.get_context_fragment()["affinity_avg"]
+        social_affinity = self.relationships.affinity_avg()
         stress = world_context.get("noise", 0.5)
         self.mood_engine.update(comfort, social_affinity, stress)
 
         # --- Update NPCs and memory ---
         self.npc_manager.update_all(world_context)
         self.memory.decay_all(days=1.0)
+        self._mutations_since_save += 1
 
-        # --- Save ephemeral memory if any ---
-        if len(self.session_memory.entries) > 100:
+        # --- Save ephemeral memory if any (throttled, deferred while batching) ---
+        if (len(self.session_memory.entries) > 100
+                and self._mutations_since_save >= self.autosave_every
+                and not self._batch_depth):
             self.save()
 
     # --------------------------------------------------------
     # === Persistence ========================================
     # --------------------------------------------------------
 
-    def save(self):
+    def enable_exit_flush(self):
+        """Opt in: flush() unsaved changes when the interpreter exits."""
+        if self._exit_hook is None:
+            # weakly held: engines may be discarded before exit
+            self._exit_hook = partial(_flush_at_exit, weakref.ref(self))
+            atexit.register(self._exit_hook)
+
+    def disable_exit_flush(self):
+        if self._exit_hook is not None:
+            atexit.unregister(self._exit_hook)
+            self._exit_hook = None
+
+    def _state_revision(self) -> int:
+        # every persisted sub-manager bumps its own counter on change, so the sum
+        # moves whenever anything that save() writes has changed
+        return (self.relationships.revision + self.memory.revision
+                + self.npc_manager.revision + self.session_memory.revision)
+
+    @property
+    def dirty(self) -> bool:
+        """True if persisted state changed since the last save/load."""
+        return self._state_revision() != self._saved_revision
+
+    def save(self, pretty: bool = False):
+        """Write state compactly; pass pretty=True for an indented, human-readable file."""
         data = {
             "theme": self.theme,
             "relationships": self.relationships.relations,
-            "memory": {k: e.to_dict() for k, e in self.memory.events.items()},
+            "memory": self.memory.events,
             "npcs": self.npc_manager.npcs,
             "session": self.session_memory.entries,
             "last_update": self.last_update.isoformat(),
         }
-        os.makedirs(os.path.dirname(self.storage_path), exist_ok=True)
-        with open(self.storage_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        directory = os.path.dirname(self.storage_path)
+        if directory and directory != self._ensured_dir:
+            os.makedirs(directory, exist_ok=True)
+            self._ensured_dir = directory
+        _write_json(self.storage_path, data, pretty)
+        self._saved_revision = self._state_revision()
+        self._mutations_since_save = 0
+
+    def flush(self):
+        """Save only if state changed since the last write."""
+        if self.dirty:
+            self.save()
+
+    @contextmanager
+    def batch(self):
+        """Defer autosaves for a block of updates and flush once at the end."""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.flush()
 
     def load(self):
         if not os.path.exists(self.storage_path):
-            print(f"[INFO] No previous character state at {self.storage_path}")
+            _LOG.info("No previous character state at %s", self.storage_path)
             return
         try:
-            with open(self.storage_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = _read_json(self.storage_path)
             self.theme = data.get("theme", self.theme)
-            self.relationships.relations = data.get("relationships", {})
-            self.npc_manager.npcs = data.get("npcs", {})
-            self.session_memory.entries = data.get("session", [])
-            for k, v in data.get("memory", {}).items():
-                self.memory.events[k] = MemoryEvent(v["event_id"], v["summary"], v["tags"])
-                self.memory.events[k].familiarity = v.get("familiarity", 0.5)
+            self.relationships.restore(data.get("relationships", {}))
+            self.npc_manager.restore(data.get("npcs", {}))
+            self.session_memory.restore(data.get("session", []))
+            for v in data.get("memory", {}).values():
+                event = MemoryEvent(v["event_id"], v["summary"], v["tags"], v.get("timestamp"))
+                event.familiarity = v.get("familiarity", 0.5)
+                self.memory.add(event)
         except Exception as e:
-            print("[WARN] Failed to load character state:", e)
+            _LOG.warning("Failed to load character state: %s", e)
 
     # --------------------------------------------------------
     # === Export Context =====================================
     # --------------------------------------------------------
 
     def get_context_fragment(self) -> Dict[str, Any]:
-        ctx = {}
-        ctx.update(self.relationships.get_context_fragment())
-        ctx.update(self.mood_engine.get_context_fragment())
-        ctx.update(self.memory.get_context_fragment())
-        ctx.update(self.npc_manager.get_context_fragment())
-        ctx.update(self.session_memory.get_context_fragment())
-        return ctx
+        # one literal (same keys/order as merging each sub-fragment) from the running totals
+        relationships, memory, npcs = self.relationships, self.memory, self.npc_manager
+        return {
+            "relationship_count": len(relationships.relations),
+            "affinity_avg": relationships.affinity_avg(),
+            "mood": round(self.mood_engine.base_mood, 3),
+            "memory_count": len(memory.events),
+            "familiarity_avg": memory.familiarity_avg(),
+            "npc_count": len(npcs.npcs),
+            "npc_mood_avg": npcs.mood_avg(),
+            "session_entry_count": len(self.session_memory.entries),
+        }
@@ -3,9 +3,44 @@
 # Generic JSON table merger for modular data-driven systems.
 # ============================================================
 
-import os, json, glob
+import os, json, logging
+from functools import lru_cache
 from chronikeeper_engines.core_paths import DATA_ROOT
 
+try:
+    import orjson  # optional: faster parsing of the data tables
+except ImportError:
+    orjson = None
+
+_LOG = logging.getLogger(__name__)
+
+
+def _read_json(path: str):
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=64)
+def _list_data(base_dir: str, prefix: str):
+    """{prefix}*.json files in base_dir, defaults first (cached: data dirs rarely change)."""
+    hidden_ok = prefix.startswith(".")
+    files = [
+        e.path for e in os.scandir(base_dir)
+        if e.name.startswith(prefix) and e.name.endswith(".json")
+        and (hidden_ok or not e.name.startswith("."))
+    ]
+    files.sort(key=lambda f: "default" not in f)
+    return tuple(files)
+
+
+def clear_listing_cache():
+    """Forget cached directory listings (call after adding data files at runtime)."""
+    _list_data.cache_clear()
+
+
 def load_tables(base_dir: str, theme: str = "default", prefix: str = "", fallback_data=None):
     """
     Auto-loads and merges all JSON files matching {prefix}{theme or default}_*.json.
@@ -14,18 +49,15 @@ def load_tables(base_dir: str, theme: str = "default", prefix: str = "", fallbac
     """
     tables = {}
     if not os.path.exists(base_dir):
-        print(f"[WARN] Missing data directory: {base_dir}")
+        _LOG.warning("Missing data directory: %s", base_dir)
         return fallback_data or {}
 
-    files = glob.glob(os.path.join(base_dir, f"{prefix}*.json"))
-    # Load defaults first
-    files.sort(key=lambda f: "default" not in f)
+    files = _list_data(base_dir, prefix)
 
     theme_files = [f for f in files if "default" in f or theme in f]
     for path in theme_files:
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = _read_json(path)
             # Deep merge
             for k, v in data.items():
                 if isinstance(v, dict):
@@ -33,10 +65,10 @@ def load_tables(base_dir: str, theme: str = "default", prefix: str = "", fallbac
                 else:
                     tables[k] = v
         except Exception as e:
-            print(f"[WARN] Failed to load {path}: {e}")
+            _LOG.warning("Failed to load %s: %s", path, e)
     if not tables and fallback_data:
         tables = fallback_data
-    print(f"[INFO] Loaded {len(theme_files)} data files from '{base_dir}' (theme='{theme}')")
+    _LOG.info("Loaded %d data files from '%s' (theme='%s')", len(theme_files), base_dir, theme)
     return tables
 
 def load_relationship_tables(theme: str = "default"):
@@ -44,7 +76,6 @@ def load_relationship_tables(theme: str = "default"):
     alt_path = os.path.join(DATA_ROOT, "relationship_tables", f"{theme}_relationship_weights.json")
     for path in (base_path, alt_path):
         if os.path.exists(path):
-            with open(path, "r", encoding="utf-8") as f:
-                return json.load(f)
-    print(f"[WARN] relationship table not found: {base_path}")
+            return _read_json(path)
+    _LOG.warning("relationship table not found: %s", base_path)
     return {}
@@ -0,0 +1,13 @@
+# ============================================================
+# ChroniKeeper – test package bootstrap
+# Runs once per session for `python -m chronikeeper_engines.tests.<name>`
+# and for run_tests.py (which imports tests.<name>). Test files keep a
+# small path guard of their own so they also run as plain scripts.
+# ============================================================
+
+import os
+import sys
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
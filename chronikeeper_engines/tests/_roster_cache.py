@@ -0,0 +1,18 @@
+# ============================================================
+# ChroniKeeper – Shared test NPC roster
+# ============================================================
+
+from functools import lru_cache
+from typing import Any, Dict
+
+from chronikeeper_engines.simulation_core.character_state_engine import NPCManager
+
+
+@lru_cache(maxsize=1)
+def default_roster() -> Dict[str, Dict[str, Any]]:
+    """Standard three-NPC roster, built once; load it with NPCManager.load_roster (which copies)."""
+    mgr = NPCManager()
+    mgr.register("Aiden", "technician", "day")
+    mgr.register("Bella", "teacher", "morning")
+    mgr.register("Carlos", "student", "afternoon")
+    return mgr.npcs
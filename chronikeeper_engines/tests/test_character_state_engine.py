@@ -5,15 +5,15 @@
 import os, sys
 from datetime import datetime
 
-# --- Force working directory to project root ---
-CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
-PROJECT_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, "..", ".."))
-sys.path.insert(0, PROJECT_ROOT)
-os.chdir(PROJECT_ROOT)
+# --- allow running this file directly (python tests/test_character_state_engine.py) ---
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
 
 # --- Imports from core packages ---
 from chronikeeper_engines.world_core import WorldState, EnvironmentEngine
 from chronikeeper_engines.simulation_core import CharacterStateEngine
+from chronikeeper_engines.tests._roster_cache import default_roster
 
 
 print("=== ChroniKeeper Character State Integration Test ===")
@@ -35,18 +35,18 @@ for _ in range(8):
 # ------------------------------------------------------------
 char_engine = CharacterStateEngine(theme="default")
 
-# Create a few NPCs
-char_engine.npc_manager.register("Aiden", "technician", "day")
-char_engine.npc_manager.register("Bella", "teacher", "morning")
-char_engine.npc_manager.register("Carlos", "student", "afternoon")
+# Load the shared test roster (built once per process)
+char_engine.npc_manager.load_roster(default_roster())
 
 # ------------------------------------------------------------
 # 3️⃣ Run daily update ticks
 # ------------------------------------------------------------
 print("\n[INFO] Running daily state updates...")
+# resolve how to read the signature once; the engine API does not change mid-loop
+_get_sig = env_engine.get_signature if hasattr(env_engine, "get_signature") else (lambda: env_engine.signature)
 for hour in range(0, 24, 6):
     # Sync world with environment
-    world.environment_signature = getattr(env_engine, "get_signature", None)() if hasattr(env_engine, "get_signature") else env_engine.signature
+    world.environment_signature = _get_sig()
 
     # Update character state based on environment
     char_engine.update_state(world.environment_signature)
@@ -0,0 +1,67 @@
+# ============================================================
+# ChroniKeeper – Test: CharacterStateEngine flush() / dirty tracking
+# ============================================================
+
+import os, sys
+import tempfile
+
+# --- allow running this file directly (python tests/test_character_state_persistence.py) ---
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from chronikeeper_engines.simulation_core import CharacterStateEngine, MemoryEvent
+
+
+def main():
+    print("=== ChroniKeeper Character State Persistence Test ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "state.json")
+        engine = CharacterStateEngine(storage_path=path)
+
+        # exit flush is opt-in; a plain engine leaves nothing registered
+        assert engine._exit_hook is None
+        engine.enable_exit_flush()
+        engine.disable_exit_flush()
+        assert engine._exit_hook is None
+
+        # nothing changed yet: flush must not write
+        assert not engine.dirty
+        engine.flush()
+        assert not os.path.exists(path)
+
+        # changes made outside update_state still have to reach disk
+        engine.relationships.adjust("baker", +0.2)
+        engine.npc_manager.register("Mira", "guard", "night")
+        engine.session_memory.add("Asked the baker about the fire")
+        event = MemoryEvent("fire_01", "Saw smoke near the docks", ["place:docks"])
+        engine.memory.add(event)
+        assert engine.dirty
+        engine.flush()
+        assert not engine.dirty
+
+        # a direct edit on a stored event marks the engine dirty too
+        event.reinforce(0.3)
+        assert engine.dirty
+        engine.flush()
+
+        reloaded = CharacterStateEngine(storage_path=path)
+        print("[RELOADED]", reloaded.get_context_fragment())
+        assert abs(reloaded.relationships.get_affinity("baker") - 0.7) < 1e-9
+        assert "Mira" in reloaded.npc_manager.npcs
+        assert list(reloaded.session_memory.entries) == ["Asked the baker about the fire"]
+        assert abs(reloaded.memory.events["fire_01"].familiarity - 0.8) < 1e-9
+        assert not reloaded.dirty
+
+        # batch() flushes once at the end, and only if something changed
+        mtime = os.path.getmtime(path)
+        with reloaded.batch():
+            pass
+        assert os.path.getmtime(path) == mtime
+
+    print("[OK] flush() writes every change and skips clean state")
+
+
+if __name__ == "__main__":
+    main()
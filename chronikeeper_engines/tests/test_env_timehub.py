@@ -6,7 +6,9 @@ env.hemisphere = "north"
 env.latitude = 30.0
 
 print("=== One-day simulation ===")
-for hour in range(0, 25, 3):
-    env.set_hour(hour)
-    sig = env.update()
-    print(f"{hour:02d}h | Season:{sig['season']:<7} T:{sig['temperature']:.2f} Comfort:{sig['comfort']:.2f} Night:{sig['is_night']}")
+hours = range(0, 25, 3)
+sigs = env.update_many(hours)
+for hour, season, temp, comfort, night in zip(
+    hours, sigs["season"], sigs["temperature"], sigs["comfort"], sigs["is_night"]
+):
+    print(f"{hour:02d}h | Season:{season:<7} T:{temp:.2f} Comfort:{comfort:.2f} Night:{night}")
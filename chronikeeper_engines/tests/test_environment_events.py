@@ -1,6 +1,7 @@
 # tests/test_environment_events.py
 # Demonstrates forcing storm/fog/heatwave and seasonal/area fade
 
+import sys
 from environment_engine import EnvironmentEngine
 from world_state import WorldState
 
@@ -30,13 +31,15 @@ def main():
     # force a storm for testing
     env.set_test_flag("storm", duration=6)
 
+    rows = []
     for i in range(10):
         ws.advance_time(1)
         sig = ws.environment_signature
-        print(f"Tick {i:02d} | {ws.describe_time()} | "
+        rows.append(f"Tick {i:02d} | {ws.describe_time()} | "
               f"Ev:{sig['active_events']}({sig['event_intensity']}) | "
               f"Prec:{sig['precipitation']:.2f} Vis:{sig['visibility']:.2f} "
               f"Comfort:{sig['comfort']:.2f} Wind:{sig['wind_kmh']:.1f} km/h")
+    sys.stdout.write("\n".join(rows) + "\n")
 
     print("\n--- Switching to mountain village (should clear faster) ---\n")
 
@@ -57,11 +60,13 @@ def main():
 
     env2.set_test_flag("fog", duration=5)
 
+    rows = []
     for i in range(8):
         ws2.advance_time(1)
         sig = ws2.environment_signature
-        print(f"[MTN] {ws2.describe_time()} | Ev:{sig['active_events']}({sig['event_intensity']}) "
+        rows.append(f"[MTN] {ws2.describe_time()} | Ev:{sig['active_events']}({sig['event_intensity']}) "
               f"| Vis:{sig['visibility']:.2f} | Wind:{sig['wind_kmh']:.1f} km/h")
+    sys.stdout.write("\n".join(rows) + "\n")
 
 if __name__ == "__main__":
     main()
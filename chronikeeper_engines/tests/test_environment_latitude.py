@@ -34,18 +34,18 @@ def run_latitude_test(lat, label):
 
     ws = DummyWorld(ctx)
 
-    # simulate 4 seasonal days
-    for day in [30, 100, 180, 300]:
-        env.time_state["day_of_year"] = day
-        env.time_state["is_night"] = False
-        env.time_state["hour"] = 12.0
-        result = env.update(ws)
+    # simulate 4 seasonal days, all at noon, in one batched sweep
+    days = [30, 100, 180, 300]
+    results = env.update_many([12.0] * len(days), days, world_state=ws)
+    for day, local, temp, comfort in zip(
+        days, results["local_context"], results["temperature"], results["comfort"]
+    ):
         print(
             f"Day {day:3d} | "
-            f"Daylight: {result['ctx']['daylight_hours']:4.1f}h | "
-            f"Daylight factor: {result['ctx']['daylight_factor']:.3f} | "
-            f"Temp-like Heat: {result['temperature']:.2f} | "
-            f"Comfort: {result['comfort']:.2f}"
+            f"Daylight: {local['daylight_hours']:4.1f}h | "
+            f"Daylight factor: {local['daylight_factor']:.3f} | "
+            f"Temp-like Heat: {temp:.2f} | "
+            f"Comfort: {comfort:.2f}"
         )
 
 
@@ -0,0 +1,46 @@
+# ============================================================
+# ChroniKeeper – Test: MapManager coord index over "x,y" keys
+# ============================================================
+
+import os, sys
+import json
+import tempfile
+
+# --- allow running this file directly (python tests/test_map_index.py) ---
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from chronikeeper_engines.world_core.map_manager import MapManager
+
+
+def main():
+    print("=== ChroniKeeper MapManager Coord Index Test ===")
+
+    grid = {
+        "1,2": {"biome": "forest"},
+        "-3,4": {"biome": "urban"},
+        # none of these are tile coords; loading must skip them, not crash
+        "--1,2": {"biome": "bad"},
+        "²,1": {"biome": "bad"},
+        "+1,2": {"biome": "bad"},
+        "01,2": {"biome": "bad"},
+        "home": {"biome": "bad"},
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        grid_path = os.path.join(tmp, "grid.json")
+        with open(grid_path, "w", encoding="utf-8") as f:
+            json.dump(grid, f)
+        mm = MapManager(grid_path=grid_path)
+
+    index = mm._grid_by_xy
+    print("[INDEX]", sorted(index))
+    assert sorted(index) == [(-3, 4), (1, 2)]
+    assert mm._get_grid_tile([1, 2])["biome"] == "forest"
+    assert mm._get_grid_tile([-3, 4])["biome"] == "urban"
+
+    print("[OK] non-canonical keys are skipped")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,14 @@
 import os, sys
+
+# --- allow running this file directly (python tests/test_map_manager.py) ---
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
 from map_manager import MapManager
 
-# --- ensure we are using the project root as base path ---
-CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
-PROJECT_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, ".."))
-DATA_ROOT = os.path.join(PROJECT_ROOT, "data")
 print("=== ChroniKeeper MapManager Test ===")
 
-# ensure paths resolve from project root
-ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-os.chdir(ROOT_DIR)
-sys.path.insert(0, ROOT_DIR)
-
 mm = MapManager()
 
 tiles = ["A1", "A2", "B1", "B2", "C1", "C2", "HOME_PLAYER"]
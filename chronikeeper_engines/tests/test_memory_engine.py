@@ -0,0 +1,51 @@
+# ============================================================
+# ChroniKeeper – Test: MemoryEngine familiarity bookkeeping
+# ============================================================
+
+import os, sys
+
+# --- allow running this file directly (python tests/test_memory_engine.py) ---
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from chronikeeper_engines.simulation_core import MemoryEngine, MemoryEvent
+
+
+def _true_avg(engine):
+    events = engine.events.values()
+    return sum(e.familiarity for e in events) / len(events)
+
+
+def main():
+    print("=== ChroniKeeper MemoryEngine Test ===")
+
+    engine = MemoryEngine()
+    a = MemoryEvent("a", "Met the baker", ["npc:baker", "place:market"])
+    b = MemoryEvent("b", "Heard a rumor", ["place:market"])
+    engine.add(a)
+    engine.add(b)
+
+    # changes made on the stored events themselves must reach the engine's average
+    a.reinforce(0.2)
+    print(f"after a.reinforce  avg={engine.familiarity_avg():.4f}")
+    assert abs(engine.familiarity_avg() - _true_avg(engine)) < 1e-12
+
+    b.familiarity = 0.9
+    b.decay(3)
+    engine.decay_all(2)
+    engine.reinforce_by_tag("place:market", 0.05)
+    print(f"after mixed edits  avg={engine.familiarity_avg():.4f}")
+    assert abs(engine.familiarity_avg() - _true_avg(engine)) < 1e-12
+
+    # a replaced event stops counting, even if it is still changed afterwards
+    engine.add(MemoryEvent("a", "Met the baker again", ["npc:baker"]))
+    a.reinforce(0.3)
+    print(f"after replacing a  avg={engine.familiarity_avg():.4f}")
+    assert abs(engine.familiarity_avg() - _true_avg(engine)) < 1e-12
+
+    print("[OK] familiarity_avg stays in step with the events")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@
 # ChroniKeeper – Test: Moon Phase & Night Visibility
 # ============================================================
 
+import sys
 from environment_engine import EnvironmentEngine
 from world_state import WorldState
 
@@ -18,17 +19,22 @@ def main():
     env.set_hour(0.0)
     print(f"{'Day':>3} | {'Hour':>4} | {'Phase':<18} | {'MoonLight':>9} | {'VisFloor':>9} | {'Season':>8}")
 
-    # --- Simulate 30 consecutive nights ---
-    for day in range(1, 31):
-        env.time_state["is_night"] = True
-        sig = env.update(ws)
-
-        print(f"{day:3d} | {env.time_state['hour']:4.1f} | "
-              f"{sig['moon_phase']:<18} | {sig['moon_light']:9.2f} | "
-              f"{sig['visibility']:9.2f} | {sig['season']:>8}")
-
-        # advance one day (24h)
-        env.advance_time(24)
+    # --- Simulate 30 consecutive nights (midnight each day) in one sweep ---
+    start = env.time_state["day_of_year"]
+    days = [((start - 1 + i) % 360) + 1 for i in range(30)]  # same wrap as advance_time
+    hours = [0.0] * len(days)
+    sigs = env.update_many(hours, days, world_state=ws)
+    phases, lights = env.moon_phases(days)
+
+    rows = [
+        f"{day:3d} | {hour:4.1f} | "
+        f"{phase:<18} | {light:9.2f} | "
+        f"{vis:9.2f} | {season:>8}"
+        for day, hour, phase, light, vis, season in zip(
+            range(1, 31), hours, phases, lights, sigs["visibility"], sigs["season"]
+        )
+    ]
+    sys.stdout.write("\n".join(rows) + "\n")
 
     print("\n=== Cycle complete ===")
     print("You should see phases from New Moon → Full Moon → back to Crescent.")
@@ -3,6 +3,7 @@
 # Simulates several in-world days with automatic hourly updates
 # ============================================================
 
+import sys
 from environment_engine import EnvironmentEngine
 from world_state import WorldState
 import time as realtime
@@ -24,6 +25,10 @@ def run_timecycle_test(days=2, step_hours=3, sleep_between=0.0):
     ws.hemisphere = "north"
     ws.set_location("city_center")
 
+    # rows are written in one go unless live (slowed-down) output was asked for
+    rows = []
+    emit = print if sleep_between else rows.append
+
     total_steps = int((24 / step_hours) * days)
     for tick in range(total_steps):
         ws.advance_time(step_hours)
@@ -36,7 +41,7 @@ def run_timecycle_test(days=2, step_hours=3, sleep_between=0.0):
         season = ws.get_season()
         night_emoji = "🌙" if sig["is_night"] else "☀️"
 
-        print(f"Day {day:02d} | {hour:04.1f}h {night_emoji} | "
+        emit(f"Day {day:02d} | {hour:04.1f}h {night_emoji} | "
               f"Season: {season:<7} | "
               f"T:{sig['temperature']:.2f} | "
               f"Comfort:{sig['comfort']:.2f} | "
@@ -46,6 +51,8 @@ def run_timecycle_test(days=2, step_hours=3, sleep_between=0.0):
         if sleep_between:
             realtime.sleep(sleep_between)
 
+    if rows:
+        sys.stdout.write("\n".join(rows) + "\n")
     print("\n=== Simulation complete ===")
     print(f"Final: {ws.describe_time()} | {ws.describe_environment()}\n")
 
@@ -1,5 +1,7 @@
 import os
 import sys
+import asyncio
+from contextlib import asynccontextmanager, suppress
 
 # ✅ Make sure project root is on path BEFORE imports
 ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
@@ -18,7 +20,28 @@ from chronikeeper_engines.world_core.world_state import WorldState
 from chronikeeper_engines.prompt_core.prompt_manager import PromptManager
 
 
-app = FastAPI(title="ChroniKeeper Web UI")
+async def _periodic_save():
+    while True:
+        await asyncio.sleep(SAVE_INTERVAL)
+        char_engine.flush()
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    # startup: periodic autosave; shutdown: stop it, then write what is left
+    app.state.autosave_task = asyncio.create_task(_periodic_save())
+    try:
+        yield
+    finally:
+        task = getattr(app.state, "autosave_task", None)
+        if task is not None:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+        char_engine.flush()
+
+
+app = FastAPI(title="ChroniKeeper Web UI", lifespan=_lifespan)
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 templates = Jinja2Templates(directory=os.path.join(BASE_DIR, "ui_templates"))
@@ -27,9 +50,23 @@ app.mount("/static", StaticFiles(directory=os.path.join(BASE_DIR, "ui_static")),
 # --- init engines ---
 world = WorldState()
 world.environment_engine = EnvironmentEngine()
-char_engine = CharacterStateEngine()
+char_engine = CharacterStateEngine(flush_at_exit=True)
 prompt_manager = PromptManager(char_engine, world)
 
+# ticks only mark the character state dirty; it is written at most this often (seconds)
+SAVE_INTERVAL = 5.0
+
+# refresh world signature (different versions name this differently); resolved once,
+# since the WorldState API does not change between ticks
+if hasattr(world, "update_environment"):
+    _refresh_signature = world.update_environment
+elif hasattr(world, "refresh"):
+    _refresh_signature = world.refresh
+else:
+    def _refresh_signature():
+        # fallback: pull it directly from env
+        world.environment_signature = world.environment_engine.signature
+
 
 @app.get("/", response_class=HTMLResponse)
 async def dashboard(request: Request):
@@ -47,21 +84,12 @@ async def api_tick(hours: float = 0.05):
     # 1) advance env time
     world.environment_engine.advance_time(hours)
 
-    # 2) refresh world signature (different versions name this differently)
-    if hasattr(world, "update_environment"):
-        world.update_environment()
-    elif hasattr(world, "refresh"):
-        world.refresh()
-    else:
-        # fallback: pull it directly from env
-        world.environment_signature = world.environment_engine.signature
+    # 2) refresh world signature
+    _refresh_signature()
 
-    # 3) let character react
+    # 3) let character react (persisted by the periodic autosave / shutdown hook)
     char_engine.update_state(world.environment_signature)
 
-    # 4) persist
-    char_engine.save()
-
     return JSONResponse({
         "ok": True,
         "hours": hours,
@@ -69,6 +97,13 @@ async def api_tick(hours: float = 0.05):
     })
 
 
+@app.get("/api/flush")
+async def api_flush():
+    # explicit sync point for clients that need the state on disk now
+    char_engine.flush()
+    return JSONResponse({"ok": True})
+
+
 @app.get("/api/prompt")
 async def api_prompt():
     prompt_text = prompt_manager.build_instruction_prompt("Look around.")
@@ -5,6 +5,10 @@
 
 import math
 import random
+import logging
+from functools import lru_cache
+
+_LOG = logging.getLogger(__name__)
 
 # ----- baselines -----
 CLIMATE_BASELINES = {
@@ -21,6 +25,9 @@ SEASON_MODIFIERS = {
     "winter": {"temperature": -0.28, "humidity": 0.0,   "precipitation": +0.05}
 }
 
+# season → how bright nights/days feel (visibility floor)
+SEASON_VISIBILITY_BIAS = {"summer": 0.35, "spring": 0.25, "autumn": 0.20, "winter": 0.10}
+
 # season → how fast weather clears
 SEASON_FADE_MODIFIERS = {
     "spring": 0.7,   # smoother
@@ -37,9 +44,97 @@ SEASON_WEATHER_BIAS = {
     "winter": {"fog": 0.04, "snow": 0.05}
 }
 
+# season → (fog, rain, storm) auto-spawn thresholds; fog gets a small coastal floor
+_SPAWN_THRESHOLDS = {
+    season: (bias.get("fog", 0.0) + 0.01, bias.get("rain", 0.0), bias.get("storm", 0.0))
+    for season, bias in SEASON_WEATHER_BIAS.items()
+}
+_SPAWN_THRESHOLDS_DEFAULT = (0.0 + 0.01, 0.0, 0.0)
+
+MOON_PHASE_NAMES = (
+    "New Moon", "Waxing Crescent", "First Quarter", "Waxing Gibbous",
+    "Full Moon", "Waning Gibbous", "Last Quarter", "Waning Crescent"
+)
+# light factor roughly scaled by phase
+MOON_LIGHT_CURVE = (0.05, 0.15, 0.3, 0.5, 1.0, 0.5, 0.3, 0.15)
+MOON_CYCLE_DAYS = 29
+
+# day_of_year % 29 → (phase_name, light_factor); the phase is purely a function of the day
+_MOON_TABLE = tuple(
+    (MOON_PHASE_NAMES[int((d / MOON_CYCLE_DAYS) * 8)], MOON_LIGHT_CURVE[int((d / MOON_CYCLE_DAYS) * 8)])
+    for d in range(MOON_CYCLE_DAYS)
+)
+
+# update() inlines this as max(lo, min(hi, v)) to skip the call per field
 def _clamp(v, lo=0.0, hi=1.0):
     return max(lo, min(hi, v))
 
+@lru_cache(maxsize=4096)
+def _daylight_hours(latitude, day_of_year):
+    """Clamped astronomical day length; only changes once per simulated day."""
+    declination = 23.44 * math.sin(math.radians((360 / 365.0) * (day_of_year - 80)))
+    lat_r = math.radians(latitude)
+    dec_r = math.radians(declination)
+    try:
+        hour_angle = math.acos(-math.tan(lat_r) * math.tan(dec_r))
+        daylight_hours = 24.0 * hour_angle / math.pi
+    except ValueError:
+        # Polar edge cases: full day or night
+        daylight_hours = 24.0 if latitude * declination > 0 else 0.0
+    return _clamp(daylight_hours, 0.0, 24.0)
+
+# event type → additive effects at full intensity
+EVENT_EFFECTS = {
+    "storm": {
+        "precipitation": +0.40,
+        "visibility": -0.60,
+        "comfort": -0.30,
+        "airflow": +0.30,
+        "noise": +0.20,
+    },
+    "rain": {
+        "precipitation": +0.20,
+        "visibility": -0.30,
+        "comfort": -0.10,
+        "air_quality": +0.05,
+    },
+    "fog": {
+        "visibility": -0.50,
+        "comfort": -0.10,
+        "airflow": -0.20,
+    },
+    "heatwave": {
+        "temperature": +0.25,
+        "comfort": -0.30,
+        "air_quality": -0.20,
+        "airflow": -0.10,
+    },
+}
+
+# canonical order of an event's "slots" tuple (see _build_event)
+EFFECT_SLOTS = ("temperature", "precipitation", "visibility", "comfort", "airflow", "air_quality", "noise")
+_EVENT_SLOTS = {
+    etype: tuple(effects.get(k, 0.0) for k in EFFECT_SLOTS)
+    for etype, effects in EVENT_EFFECTS.items()
+}
+
+# season by [hemisphere offset + month - 1]: north at 0, south (reversed) at 12
+_SEASON_TABLE = (
+    "winter", "winter", "spring", "spring", "spring", "summer",
+    "summer", "summer", "autumn", "autumn", "autumn", "winter",
+    "summer", "summer", "autumn", "autumn", "autumn", "winter",
+    "winter", "winter", "spring", "spring", "spring", "summer",
+)
+
+@lru_cache(maxsize=None)
+def _baseline(climate, season):
+    """(temperature, humidity, precipitation, air_quality) for climate + season, clamped once."""
+    base = CLIMATE_BASELINES.get(climate, CLIMATE_BASELINES["temperate"]).copy()
+    for k, v in SEASON_MODIFIERS.get(season, {}).items():
+        if k in base:
+            base[k] = _clamp(base[k] + v)
+    return base["temperature"], base["humidity"], base["precipitation"], base["air_quality"]
+
 class EnvironmentEngine:
     """
     v4 – central time hub + environment + weather events.
@@ -50,6 +145,13 @@ class EnvironmentEngine:
     - outputs web/UI friendly fields (incl. wind_kmh)
     """
 
+    __slots__ = (
+        "random", "map_manager", "time_state", "_hemisphere", "_season_offset", "latitude",
+        "prev_temperature", "active_events", "test_flags", "auto_weather_enabled",
+        "current_fade_speed", "signature", "_pending_hours", "_total_elapsed_hours",
+        "lag_tolerance", "_last_update_hour", "_idle_key",
+    )
+
     def __init__(self, seed=None, map_manager=None):
         self.random = random.Random(seed)
         self.map_manager = map_manager
@@ -70,18 +172,29 @@ class EnvironmentEngine:
         self.prev_temperature = 0.5
 
         # weather/event state
-        self.active_events = []      # list of {"type":..., "duration":..., "fade":..., "effects":{...}, "test":bool}
+        self.active_events = []      # list of {"type":..., "duration":..., "fade":..., "effects":{...}, "slots":(...), "test":bool}
         self.test_flags = []         # names of forced events
         self.auto_weather_enabled = False  # later can be True
         self.current_fade_speed = 1.0
 
-        # last signature
+        # last signature (+ key of the idle state it was computed from)
         self.signature = {}
+        self._idle_key = None
         # --- Time control buffer for LLM synchronization ---
         self._pending_hours = 0.0
         self._total_elapsed_hours = 0.0
         self.lag_tolerance = 0.05  # ~3 min grace before auto-commit
 
+    @property
+    def hemisphere(self):
+        return self._hemisphere
+
+    @hemisphere.setter
+    def hemisphere(self, value):
+        # resolve the season-table offset once instead of on every get_season()
+        self._hemisphere = value
+        self._season_offset = 0 if value == "north" else 12
+
     # =========================================================
     # TIME
     # =========================================================
@@ -92,21 +205,28 @@ class EnvironmentEngine:
     def advance_time(self, hours: float = 1.0):
         """Advance world time forward by N hours (supports fractions)."""
         h = self.time_state["hour"] + hours
-        while h >= 24.0:
-            h -= 24.0
-            self._advance_day()
+        if h >= 24.0:
+            # O(1) for long jumps (sleep, travel) instead of one step per day
+            days, h = divmod(h, 24.0)
+            self._advance_days(int(days))
         self.time_state["hour"] = h
         self._update_day_night()
 
 
     def _advance_day(self):
-        self.time_state["day"] += 1
-        self.time_state["day_of_year"] += 1
-        if self.time_state["day_of_year"] > 360:
-            self.time_state["day_of_year"] = 1
-            self.time_state["year"] += 1
+        self._advance_days(1)
+
+    def _advance_days(self, days: int):
+        ts = self.time_state
+        ts["day"] += days
+        doy = ts["day_of_year"] + days
+        if doy > 360:
+            years, doy = divmod(doy - 1, 360)
+            ts["year"] += years
+            doy += 1
             # reset month correctly for the new year
-            self.time_state["month"] = 1
+            ts["month"] = 1
+        ts["day_of_year"] = doy
 
     def _update_month(self):
         self.time_state["month"] = int(self.time_state["day_of_year"] / 30.0) + 1
@@ -123,31 +243,13 @@ class EnvironmentEngine:
     def get_season(self):
         m = self.time_state["month"]
 
-        # Wrap month correctly
+        # Wrap month correctly (read-only: the getter no longer rewrites time_state)
         if m < 1:
             m = 1
         elif m > 12:
             m = ((m - 1) % 12) + 1
-            self.time_state["month"] = m
-
-        if self.hemisphere == "north":
-            if 3 <= m <= 5:
-                return "spring"
-            elif 6 <= m <= 8:
-                return "summer"
-            elif 9 <= m <= 11:
-                return "autumn"
-            else:
-                return "winter"
-        else:  # southern hemisphere reversed
-            if 3 <= m <= 5:
-                return "autumn"
-            elif 6 <= m <= 8:
-                return "winter"
-            elif 9 <= m <= 11:
-                return "spring"
-            else:
-                return "summer"
+
+        return _SEASON_TABLE[self._season_offset + m - 1]
     
     # =========================================================
     # TIME BUFFER CONTROL (LLM / USER SAFETY)
@@ -155,7 +257,7 @@ class EnvironmentEngine:
     def request_time(self, hours: float):
         """Queue a time delta (fractions allowed) without committing yet."""
         self._pending_hours += hours
-        print(f"[TIME] Pending +{hours:.2f}h (total pending {self._pending_hours:.2f})")
+        _LOG.debug("[TIME] Pending +%.2fh (total pending %.2f)", hours, self._pending_hours)
 
     def commit_time(self):
         """Commit pending time progression; advances the clock and environment."""
@@ -165,19 +267,19 @@ class EnvironmentEngine:
         self.advance_time(delta)
         self._pending_hours = 0.0
         self._total_elapsed_hours += delta
-        print(f"[TIME] Committed +{delta:.2f}h (total elapsed {self._total_elapsed_hours:.2f}h)")
+        _LOG.debug("[TIME] Committed +%.2fh (total elapsed %.2fh)", delta, self._total_elapsed_hours)
 
     def rollback_time(self):
         """Cancel any pending time progression (e.g., LLM regeneration or user edit)."""
         if self._pending_hours > 0.0:
-            print(f"[TIME] Rollback: canceled {self._pending_hours:.2f}h pending.")
+            _LOG.debug("[TIME] Rollback: canceled %.2fh pending.", self._pending_hours)
         self._pending_hours = 0.0
 
     def force_time_jump(self, hours: float):
         """Immediate, unconditional time advance (skip day, travel, etc.)."""
         self.advance_time(hours)
         self._total_elapsed_hours += hours
-        print(f"[TIME] Forced advance {hours:.2f}h.")
+        _LOG.debug("[TIME] Forced advance %.2fh.", hours)
 
     def graceful_tick(self, hours: float):
         """Small background drift—if AI hesitates too long, let time move slightly."""
@@ -188,16 +290,13 @@ class EnvironmentEngine:
 
     def get_moon_phase(self):
         """Return a tuple (phase_name, light_factor)."""
-        phase_names = [
-            "New Moon", "Waxing Crescent", "First Quarter", "Waxing Gibbous",
-            "Full Moon", "Waning Gibbous", "Last Quarter", "Waning Crescent"
-        ]
-        day_index = self.time_state.get("day_of_year", 0) % 29
-        phase_index = int((day_index / 29) * 8)
-        phase_name = phase_names[phase_index]
-        # Light factor roughly scaled by phase
-        light_curve = [0.05, 0.15, 0.3, 0.5, 1.0, 0.5, 0.3, 0.15]
-        return phase_name, light_curve[phase_index]
+        return _MOON_TABLE[self.time_state.get("day_of_year", 0) % MOON_CYCLE_DAYS]
+
+    @staticmethod
+    def moon_phases(days):
+        """Closed-form (phase_names, light_factors) for a sequence of day_of_year values."""
+        rows = [_MOON_TABLE[d % MOON_CYCLE_DAYS] for d in days]
+        return [name for name, _ in rows], [light for _, light in rows]
 
 
     # =========================================================
@@ -216,49 +315,21 @@ class EnvironmentEngine:
 
     def _build_event(self, event_type: str, duration: int, test: bool = False):
         """Create a standard event definition."""
-        effects = {}
         event_type = event_type.lower()
 
-        if event_type == "storm":
-            effects = {
-                "precipitation": +0.40,
-                "visibility": -0.60,
-                "comfort": -0.30,
-                "airflow": +0.30,
-                "noise": +0.20,
-            }
-        elif event_type == "rain":
-            effects = {
-                "precipitation": +0.20,
-                "visibility": -0.30,
-                "comfort": -0.10,
-                "air_quality": +0.05,
-            }
-        elif event_type == "fog":
-            effects = {
-                "visibility": -0.50,
-                "comfort": -0.10,
-                "airflow": -0.20,
-            }
-        elif event_type == "heatwave":
-            effects = {
-                "temperature": +0.25,
-                "comfort": -0.30,
-                "air_quality": -0.20,
-                "airflow": -0.10,
-            }
-        elif event_type == "clear":
-            # special – remove all
-            self.clear_test_flags()
-            return None
-        else:
+        effects = EVENT_EFFECTS.get(event_type)
+        if effects is None:
+            if event_type == "clear":
+                # special – remove all
+                self.clear_test_flags()
             return None
 
         return {
             "type": event_type,
             "duration": duration,
             "fade": 1.0,
-            "effects": effects,
+            "effects": dict(effects),
+            "slots": _EVENT_SLOTS[event_type],
             "test": test,
         }
 
@@ -266,6 +337,18 @@ class EnvironmentEngine:
     # MAIN UPDATE
     # =========================================================
     def update(self, world_state=None):        
+        # -----------------------------------------------------
+        # Idle fast path: no world, no events, no random spawns and the same
+        # clock + smoothing state as last time → the signature cannot change
+        # -----------------------------------------------------
+        idle_key = None
+        if world_state is None and not self.active_events and not self.auto_weather_enabled:
+            idle_key = (tuple(self.time_state.values()), self._season_offset,
+                        self.latitude, self.prev_temperature)
+            if idle_key == self._idle_key:
+                sig = self.signature
+                return {"ctx": sig["local_context"], **sig}
+
         # -----------------------------------------------------
         # Allow test world objects or raw dict contexts
         # -----------------------------------------------------
@@ -293,19 +376,15 @@ class EnvironmentEngine:
 
 
 
-        # --- base from climate + season
-        base = CLIMATE_BASELINES.get(climate, CLIMATE_BASELINES["temperate"]).copy()
-        seas = SEASON_MODIFIERS.get(season, {})
-        for k, v in seas.items():
-            if k in base:
-                base[k] = _clamp(base[k] + v)
+        # --- base from climate + season (precomputed per pair)
+        base_temp, base_hum, base_precip, base_airq = _baseline(climate, season)
 
         # --- diurnal
         diurnal_amp = 0.08
         if climate == "arid":
             diurnal_amp = 0.12
         diurnal = math.sin((hour / 24.0) * math.pi * 2) * diurnal_amp
-        raw_temp_base = _clamp(base["temperature"] + diurnal)
+        raw_temp_base = max(0.0, min(1.0, base_temp + diurnal))
 
         # --- map context
         # keep any latitude or test-supplied context values
@@ -319,9 +398,6 @@ class EnvironmentEngine:
 
         # merge, with test ctx taking priority
         ctx = {**map_ctx, **ctx}
-        location_id = getattr(world_state, "location_id", None) if world_state else None
-        if self.map_manager and location_id:
-            ctx = self.map_manager.get_context_fragment(location_id)
         heat_ret = float(ctx.get("heat_retention", 0.0))
         airflow  = float(ctx.get("airflow", 0.5))
         water    = float(ctx.get("water_coverage", 0.0))
@@ -331,15 +407,15 @@ class EnvironmentEngine:
         base_noise  = float(ctx.get("noise", 0.3))
 
         # --- precipitation interplay
-        precip = _clamp(base.get("precipitation", 0.0))
+        precip = max(0.0, min(1.0, base_precip))
         precip_temp_shift = -precip * 0.06
         precip_airq_shift = +precip * 0.03
 
         # --- local heat vs airflow
-        raw_temperature = _clamp(raw_temp_base + heat_ret * (1 - airflow) + precip_temp_shift)
+        raw_temperature = max(0.0, min(1.0, raw_temp_base + heat_ret * (1 - airflow) + precip_temp_shift))
 
         # --- retention smoothing
-        norm_ret = _clamp(heat_ret, -0.2, 0.6)
+        norm_ret = max(-0.2, min(0.6, heat_ret))
         memory_weight = 0.7 + norm_ret * 0.3
         new_weight = 1.0 - memory_weight
         temperature = self.prev_temperature * memory_weight + raw_temperature * new_weight
@@ -347,7 +423,7 @@ class EnvironmentEngine:
 
         # --- crowd/noise
         crowd = self._crowd_pattern(hour)
-        noise = _clamp(base_noise + crowd * 0.4)
+        noise = max(0.0, min(1.0, base_noise + crowd * 0.4))
 
         # =====================================================
         # GEOGRAPHIC + URBAN MICROCLIMATE ADJUSTMENTS
@@ -357,18 +433,7 @@ class EnvironmentEngine:
         day_of_year = self.time_state.get("day_of_year", 172)
 
         # --- Correct astronomical daylight model (now responsive to latitude) ---
-        declination = 23.44 * math.sin(math.radians((360 / 365.0) * (day_of_year - 80)))
-        lat_r = math.radians(latitude)
-        dec_r = math.radians(declination)
-        try:
-            hour_angle = math.acos(-math.tan(lat_r) * math.tan(dec_r))
-            daylight_hours = 24.0 * hour_angle / math.pi
-        except ValueError:
-            # Polar edge cases: full day or night
-            daylight_hours = 24.0 if latitude * declination > 0 else 0.0
-
-        # clamp + factor
-        daylight_hours = _clamp(daylight_hours, 0.0, 24.0)
+        daylight_hours = _daylight_hours(latitude, day_of_year)
         daylight_factor = daylight_hours / 24.0
 
         # store for later use
@@ -382,12 +447,12 @@ class EnvironmentEngine:
         # Temperature shift by latitude and season daylight
         # Lower latitudes stay warmer; higher → colder.
         # daylight_factor (0..1) shifts toward seasonal extremes.
-        lat_temp_bias = _clamp(1.0 - abs(latitude) / 90.0, 0.2, 1.0)
+        lat_temp_bias = max(0.2, min(1.0, 1.0 - abs(latitude) / 90.0))
         daylight_temp_bias = (daylight_factor - 0.5) * 0.25  # small ±0.125 swing
         seasonal_temp_adj = (lat_temp_bias * 0.3) + daylight_temp_bias
 
         # Blend into temperature smoothly
-        temperature = _clamp(temperature + seasonal_temp_adj - 0.1)
+        temperature = max(0.0, min(1.0, temperature + seasonal_temp_adj - 0.1))
 
         # Comfort also reacts to daylight length (psychological effect)
         comfort_mod += (daylight_factor - 0.5) * 0.2
@@ -400,8 +465,10 @@ class EnvironmentEngine:
         wind_redirect = float(ctx.get("wind_redirect", 0.0))
         noise_pollution = float(ctx.get("noise_pollution", 0.0))
 
+        is_night = self.time_state["is_night"]
+
         # --- urban heat island effect ---
-        if self.time_state["is_night"]:
+        if is_night:
             heat_ret += 0.1 * structure_density + 0.05 * settlement_size
         else:
             heat_ret += 0.05 * structure_density  # reflective daytime warming
@@ -411,7 +478,7 @@ class EnvironmentEngine:
 
         # --- humidity & comfort tweaks for dense areas ---
         humidity_mod = 1.0 - 0.2 * structure_density
-        base["humidity"] *= humidity_mod
+        base_hum *= humidity_mod
         comfort_mod *= 1.0 - (noise_pollution * 0.3)
 
         # --- optional: store daylight factor for diagnostics / UI ---
@@ -423,19 +490,16 @@ class EnvironmentEngine:
         # =====================================================
 
         # --- base humidity and weather visibility ---
-        humidity = _clamp(base.get("humidity", 0.5) + precip * 0.15)
+        humidity = max(0.0, min(1.0, base_hum + precip * 0.15))
         # heavier humidity impact at night → darker, murkier air
-        hum_factor = 0.5 if not self.time_state["is_night"] else 0.8
-        atmo_visibility = _clamp(1.0 - humidity * hum_factor - precip * 0.4)
+        hum_factor = 0.8 if is_night else 0.5
+        atmo_visibility = max(0.0, min(1.0, 1.0 - humidity * hum_factor - precip * 0.4))
 
         # --- daylight curve (1.0 at noon → 0.0 at midnight) ---
-        daylight_curve = 0.5 + 0.5 * math.cos(((hour - 12) / 12) * math.pi)
-        daylight_curve = _clamp(daylight_curve, 0.0, 1.0)
+        daylight_curve = max(0.0, min(1.0, 0.5 + 0.5 * math.cos(((hour - 12) / 12) * math.pi)))
 
         # --- seasonal bias (affects how bright seasons feel) ---
-        season_vis_bias = {
-            "summer": 0.35, "spring": 0.25, "autumn": 0.20, "winter": 0.10
-        }.get(season, 0.2)
+        season_vis_bias = SEASON_VISIBILITY_BIAS.get(season, 0.2)
 
         # --- moonlight & map light pollution ---
         phase_name, moon_light = self.get_moon_phase()
@@ -445,24 +509,27 @@ class EnvironmentEngine:
         settlement_size = float(ctx.get("settlement_size", 0.0))
         dist_to_city = float(ctx.get("distance_to_city", 1.0))  # in map grid units (1.0 = local tile)
 
-        # base light from settlement size (log-like growth)
-        base_light = (settlement_size / 5.0) ** 1.2
+        if settlement_size > 0.0:
+            # base light from settlement size (log-like growth)
+            base_light = (settlement_size / 5.0) ** 1.2
 
-        # exponential distance decay: near=1.0, far=~0.0
-        distance_factor = math.exp(-1.5 * dist_to_city)
+            # exponential distance decay: near=1.0, far=~0.0
+            distance_factor = math.exp(-1.5 * dist_to_city)
 
-        # combined contribution
-        settlement_light = base_light * distance_factor
+            # combined contribution
+            settlement_light = base_light * distance_factor
+        else:
+            # no settlement nearby: nothing to decay
+            settlement_light = 0.0
         
-        light_pollution = float(ctx.get("light_pollution", 0.0))
-        light_pollution = _clamp(float(ctx.get("light_pollution", 0.0)) + settlement_light, 0.0, 1.0)
+        light_pollution = max(0.0, min(1.0, float(ctx.get("light_pollution", 0.0)) + settlement_light))
 
         # --- total illumination factor (0 = pitch dark, 1 = bright daylight) ---
-        if self.time_state["is_night"]:
+        if is_night:
             # combine moonlight, pollution, and a faint twilight term
-            illumination = _clamp(moon_light * 0.5 + light_pollution * 1.2 + daylight_curve * 0.3, 0.0, 1.0)
+            illumination = max(0.0, min(1.0, moon_light * 0.5 + light_pollution * 1.2 + daylight_curve * 0.3))
         else:
-            illumination = _clamp(daylight_curve + light_pollution * 0.2, 0.0, 1.0)
+            illumination = max(0.0, min(1.0, daylight_curve + light_pollution * 0.2))
 
         # --- minimal light floor (darker winters, brighter summers) ---
         min_visibility = 0.02 + season_vis_bias * (illumination * 0.5)
@@ -471,13 +538,11 @@ class EnvironmentEngine:
         # darker nights: scale atmospheric clarity more strongly by light level
         # so new-moon rural areas can reach 0.03–0.06
         darkness_weight = 0.15 + illumination * 0.6          # 0.15 at night → 0.75 at noon
-        visibility = _clamp(atmo_visibility * darkness_weight, 0.0, 1.0)
-
         # ensure a minimal floor so fog/rain don't clamp to zero
-        visibility = max(visibility, min_visibility * 0.8)
+        visibility = max(max(0.0, min(1.0, atmo_visibility * darkness_weight)), min_visibility * 0.8)
 
         # --- air quality base
-        air_quality = _clamp(base.get("air_quality", 0.8) + local_airq + precip_airq_shift - noise * 0.08)
+        air_quality = max(0.0, min(1.0, base_airq + local_airq + precip_airq_shift - noise * 0.08))
 
         # =====================================================
         #  APPLY WEATHER EVENTS (storm, fog, rain, heatwave)
@@ -492,7 +557,7 @@ class EnvironmentEngine:
             + water * 0.20       # coastal → lingers
             - elev * 0.10        # mountains → clears faster
         )
-        fade_mod = _clamp(fade_mod, 0.2, 1.2)
+        fade_mod = max(0.2, min(1.2, fade_mod))
         fade_speed = season_fade * fade_mod
         self.current_fade_speed = fade_speed
 
@@ -507,24 +572,24 @@ class EnvironmentEngine:
         still_active = []
         for ev in self.active_events:
             # scale effects by current fade
-            intensity = _clamp(ev["fade"], 0.0, 1.0)
+            intensity = max(0.0, min(1.0, ev["fade"]))
             if intensity > 0.01:
-                for key, delta in ev["effects"].items():
-                    # additive, scaled by intensity
-                    if key == "temperature":
-                        temperature = _clamp(temperature + delta * intensity)
-                    elif key == "precipitation":
-                        precip = _clamp(precip + delta * intensity)
-                    elif key == "visibility":
-                        visibility = _clamp(visibility + delta * intensity)
-                    elif key == "comfort":
-                        comfort_mod += delta * intensity
-                    elif key == "airflow":
-                        airflow = _clamp(airflow + delta * intensity)
-                    elif key == "air_quality":
-                        air_quality = _clamp(air_quality + delta * intensity)
-                    elif key == "noise":
-                        noise = _clamp(noise + delta * intensity)
+                # additive, scaled by intensity; zero slots are fields the event does not touch
+                d_temp, d_precip, d_vis, d_comfort, d_airflow, d_airq, d_noise = ev["slots"]
+                if d_temp:
+                    temperature = max(0.0, min(1.0, temperature + d_temp * intensity))
+                if d_precip:
+                    precip = max(0.0, min(1.0, precip + d_precip * intensity))
+                if d_vis:
+                    visibility = max(0.0, min(1.0, visibility + d_vis * intensity))
+                if d_comfort:
+                    comfort_mod += d_comfort * intensity
+                if d_airflow:
+                    airflow = max(0.0, min(1.0, airflow + d_airflow * intensity))
+                if d_airq:
+                    air_quality = max(0.0, min(1.0, air_quality + d_airq * intensity))
+                if d_noise:
+                    noise = max(0.0, min(1.0, noise + d_noise * intensity))
 
                 active_event_names.append(ev["type"])
                 max_event_intensity = max(max_event_intensity, intensity)
@@ -553,14 +618,14 @@ class EnvironmentEngine:
 
 
         # --- comfort final
-        comfort = _clamp(1.0 - abs(temperature - 0.5) * 1.2 - precip * 0.3 + comfort_mod)
+        comfort = max(0.0, min(1.0, 1.0 - abs(temperature - 0.5) * 1.2 - precip * 0.3 + comfort_mod))
 
         # --- safety
-        safety = _clamp(1.0 - noise * 0.18 - (1.0 - air_quality) * 0.25 - self._night_safety_penalty(hour))
+        safety = max(0.0, min(1.0, 1.0 - noise * 0.18 - (1.0 - air_quality) * 0.25 - self._night_safety_penalty(hour)))
 
         # --- wind: from airflow + events
         # airflow (0..1) → wind_strength (0.1..1)
-        wind_strength = _clamp(0.1 + airflow * 0.9, 0.0, 1.0)
+        wind_strength = max(0.0, min(1.0, 0.1 + airflow * 0.9))
         # storm/fog/rain can also affect wind (already applied above)
         wind_kmh = round(wind_strength * 45.0, 1)  # 0..45 km/h approx
 
@@ -591,6 +656,8 @@ class EnvironmentEngine:
         }
         
         self.signature = sig
+        # only a call that left the smoothing at a fixed point can be replayed
+        self._idle_key = idle_key if idle_key is not None and self.prev_temperature == idle_key[3] else None
 
         # Graceful assignment for dicts OR object-style containers
         if world_state is not None:
@@ -605,6 +672,33 @@ class EnvironmentEngine:
         }
 
 
+    def update_many(self, hours, days=None, world_state=None):
+        """
+        Run update() once per entry of `hours` (optionally pinning day_of_year from
+        `days`) and return the signatures as columns: {field: [value per step]}.
+        This is the same as calling set_hour()/update() in a loop, side effects
+        included: afterwards the engine's clock (hour and, if given, day_of_year),
+        temperature smoothing, active/auto events and signature are those of the
+        last step, and world_state holds the last signature. Nothing is restored.
+        """
+        columns = {}
+        if days is None:
+            steps = ((None, h) for h in hours)
+        else:
+            steps = zip(days, hours)
+        update = self.update
+        for day, hour in steps:
+            if day is not None:
+                self.time_state["day_of_year"] = day
+            self.set_hour(hour)
+            for key, value in update(world_state).items():
+                col = columns.get(key)
+                if col is None:
+                    columns[key] = [value]
+                else:
+                    col.append(value)
+        return columns
+
     # =========================================================
     # HELPERS
     # =========================================================
@@ -621,15 +715,16 @@ class EnvironmentEngine:
 
     def _maybe_spawn_auto_event(self, season, water, airflow, elev):
         """Very light auto-mode; can be extended later."""
-        bias = SEASON_WEATHER_BIAS.get(season, {})
+        fog_t, rain_t, storm_t = _SPAWN_THRESHOLDS.get(season, _SPAWN_THRESHOLDS_DEFAULT)
+        roll = self.random.random
         # coastal → more fog/rain
-        if water > 0.6 and self.random.random() < bias.get("fog", 0.0) + 0.01:
+        if water > 0.6 and roll() < fog_t:
             ev = self._build_event("fog", duration=3)
             if ev: self.active_events.append(ev)
-        if water > 0.6 and self.random.random() < bias.get("rain", 0.0):
+        if water > 0.6 and roll() < rain_t:
             ev = self._build_event("rain", duration=4)
             if ev: self.active_events.append(ev)
         # mountains → storms
-        if elev > 0.7 and self.random.random() < bias.get("storm", 0.0):
+        if elev > 0.7 and roll() < storm_t:
             ev = self._build_event("storm", duration=4)
             if ev: self.active_events.append(ev)
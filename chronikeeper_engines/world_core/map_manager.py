@@ -8,7 +8,15 @@ import json
 import math
 import random
 import hashlib
-from typing import Dict, Any, Optional, Tuple
+import zlib
+from bisect import bisect_left
+from itertools import accumulate
+from typing import Dict, Any, NamedTuple, Optional, Tuple
+
+try:
+    import orjson  # optional: faster parsing of large grid/map files
+except ImportError:
+    orjson = None
 
 # --- ensure we are using the project root as base path ---
 CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -23,14 +31,55 @@ if not os.path.exists(DATA_ROOT):
 
 def _load_json(path: str) -> dict:
     if os.path.exists(path):
+        if orjson is not None:
+            with open(path, "rb") as f:
+                return orjson.loads(f.read())
         with open(path, "r", encoding="utf-8") as f:
             return json.load(f)
     print(f"[WARN] missing json: {path}")
     return {}
 
 
-def _clamp(v, lo=0.0, hi=1.0):
-    return max(lo, min(hi, v))
+def _index_by_xy(table: dict) -> Dict[Tuple[int, int], dict]:
+    """Re-key the "x,y" entries of a map/grid table as (x, y) int tuples."""
+    index = {}
+    for k, v in table.items():
+        x, sep, y = k.partition(",")
+        if not sep:
+            continue
+        try:
+            xy = (int(x), int(y))
+        except ValueError:
+            # named or malformed keys ("home", "--1,2", "²,1") are not tile coords
+            continue
+        if f"{xy[0]},{xy[1]}" == k:   # only canonical keys, as the old f-string lookup matched
+            index[xy] = v
+    return index
+
+
+def _copy_ctx(value):
+    """Copy a JSON-shaped context value down to its leaves (cheaper than copy.deepcopy)."""
+    if isinstance(value, dict):
+        return {k: _copy_ctx(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_ctx(v) for v in value]
+    return value
+
+
+class RegionInfo(NamedTuple):
+    """Per-region values read once from default_map.json "regions"."""
+    zone_type: str
+    buildings: tuple          # unique building keys, in template order
+    building_weights: dict    # optional explicit weights ("building_weights")
+    light_pollution: float
+    comfort_mod: float
+    noise_mod: float
+    safety_mod: float
+    landmarks: dict
+
+
+# landmark spatial index cell size (tiles)
+LANDMARK_BUCKET = 16
 
 
 class MapManager:
@@ -48,6 +97,18 @@ class MapManager:
     Everything is deterministic on world_seed + coord / location_id.
     """
 
+    # merged tile contexts kept in memory (least recently used are dropped first)
+    CTX_CACHE_SIZE = 1024
+
+    __slots__ = (
+        "grid_path", "world_path", "map_path", "buildings_path", "rooms_path", "locations_dir",
+        "world_seed", "world_id_version", "world_id",
+        "world_index", "map_data", "grid_data", "building_templates", "room_templates",
+        "location_overrides", "landmark_cache",
+        "_map_by_xy", "_grid_by_xy", "_landmark_buckets", "_landmark_order",
+        "_cdf_cache", "_region_info_cache", "_ctx_cache",
+    )
+
     def __init__(
         self,
         grid_path: str = None,
@@ -57,6 +118,7 @@ class MapManager:
         rooms_path: str = None,
         locations_dir: str = None,
         world_seed: str = "ChroniKeeper_Default_World",
+        world_id_version: int = 1,
         ):
         # --- default fallbacks built from detected DATA_ROOT ---
         base = DATA_ROOT
@@ -69,6 +131,7 @@ class MapManager:
 
         # --- world seed/id and data holders (unchanged) ---
         self.world_seed = world_seed
+        self.world_id_version = world_id_version
         self.world_id = self._make_world_id(world_seed)
         self.world_index = {}
         self.map_data = {}
@@ -76,6 +139,17 @@ class MapManager:
         self.building_templates = {}
         self.room_templates = {}
         self.landmark_cache = {}
+        # spatial index over landmark_cache: bucket -> landmark coords, plus registration order
+        self._landmark_buckets: Dict[Tuple[int, int], list] = {}
+        self._landmark_order: Dict[Tuple[int, int], int] = {}
+        # location_id -> hand-authored override from locations/*.json
+        self.location_overrides: Dict[str, dict] = {}
+        # cache_key -> (keys, cumulative weights, total) for static _weighted_pick tables
+        self._cdf_cache: Dict[Any, tuple] = {}
+        # region_key -> RegionInfo
+        self._region_info_cache: Dict[str, RegionInfo] = {}
+        # (location_id, coord) -> merged context; tiles are deterministic, so build once
+        self._ctx_cache: Dict[Tuple[Optional[str], Optional[Tuple[int, int]]], dict] = {}
 
         self._load_all()
 
@@ -83,9 +157,12 @@ class MapManager:
     # init helpers
     # --------------------------------------------------------
     def _make_world_id(self, seed_text: str) -> str:
-        h = hashlib.sha256(seed_text.encode()).hexdigest()
-        # 16 chars is enough to be "world-unique" for us
-        return h[:16]
+        # 16 hex chars is enough to be "world-unique" for us
+        if self.world_id_version >= 2:
+            # v2: 8-byte blake2b digest, no truncation
+            return hashlib.blake2b(seed_text.encode(), digest_size=8).hexdigest()
+        # v1 (default): truncated sha256, keeps existing worlds' ids
+        return hashlib.sha256(seed_text.encode()).hexdigest()[:16]
 
     def _load_all(self):
         # global layer (optional, for Earth-scale later)
@@ -94,9 +171,34 @@ class MapManager:
         self.map_data = _load_json(self.map_path)
         # local tile env
         self.grid_data = _load_json(self.grid_path)
+        # coord-keyed views so lookups hash an int pair instead of formatting "x,y"
+        self._map_by_xy = _index_by_xy(self.map_data)
+        self._grid_by_xy = _index_by_xy(self.grid_data)
         # building + room
         self.building_templates = _load_json(self.buildings_path)
         self.room_templates = _load_json(self.rooms_path)
+        # hand-authored locations (read once here, not per context build)
+        self.location_overrides = self._load_location_overrides()
+        self._cdf_cache.clear()
+        self._region_info_cache.clear()
+        self._ctx_cache.clear()
+
+    def _load_location_overrides(self) -> Dict[str, dict]:
+        overrides = {}
+        if not os.path.isdir(self.locations_dir):
+            return overrides
+        for entry in os.scandir(self.locations_dir):
+            if entry.name.endswith(".json") and entry.is_file():
+                overrides[entry.name[:-5]] = _load_json(entry.path)
+        return overrides
+
+    def invalidate_tile(self, location_id: Optional[str] = None, coord=None):
+        """Drop cached context for one tile, or for every tile when called without arguments."""
+        if location_id is None and coord is None:
+            self._ctx_cache.clear()
+            return
+        key = (location_id, tuple(coord) if coord is not None else None)
+        self._ctx_cache.pop(key, None)
 
     # --------------------------------------------------------
     # RNG helpers
@@ -105,20 +207,28 @@ class MapManager:
         """Stable seed for world + tile."""
         base = self.world_id
         key = base + "_" + "_".join(str(p) for p in parts)
+        if self.world_id_version >= 2:
+            # v2: CRC-32 gives a 32-bit seed directly (reseeds procedural rolls)
+            return zlib.crc32(key.encode())
+        # v1 (default): sha256-derived seed, keeps existing worlds' tile rolls
         return int(hashlib.sha256(key.encode()).hexdigest(), 16) % (2**32)
 
-    def _weighted_pick(self, rnd: random.Random, table: dict, default: str = "none") -> str:
+    def _weighted_pick(self, rnd: random.Random, table: dict, default: str = "none", cache_key=None) -> str:
+        """Pick a key by weight; pass cache_key for static tables to reuse their CDF."""
         if not table:
             return default
-        total = sum(table.values())
-        r = rnd.random() * total
-        acc = 0.0
-        for k, w in table.items():
-            acc += w
-            if r <= acc:
-                return k
+        cdf = self._cdf_cache.get(cache_key) if cache_key is not None else None
+        if cdf is None:
+            cdf = (list(table), list(accumulate(table.values())), sum(table.values()))
+            if cache_key is not None:
+                self._cdf_cache[cache_key] = cdf
+        keys, cum_weights, total = cdf
+        # first key whose cumulative weight reaches r (same as the old linear walk)
+        i = bisect_left(cum_weights, rnd.random() * total)
+        if i < len(keys):
+            return keys[i]
         # fallback
-        return list(table.keys())[0]
+        return keys[0]
 
     # --------------------------------------------------------
     # landmark helpers
@@ -126,17 +236,34 @@ class MapManager:
     def _register_landmark(self, xy, name: str, radius: int):
         if xy is None:
             return
-        self.landmark_cache[tuple(xy)] = {"name": name, "radius": radius}
+        xy = tuple(xy)
+        if xy not in self.landmark_cache:
+            self._landmark_order[xy] = len(self._landmark_order)
+        self.landmark_cache[xy] = {"name": name, "radius": radius}
+        # index the landmark in every bucket its square footprint touches
+        b = LANDMARK_BUCKET
+        lx, ly = xy
+        for bx in range(int((lx - radius) // b), int((lx + radius) // b) + 1):
+            for by in range(int((ly - radius) // b), int((ly + radius) // b) + 1):
+                bucket = self._landmark_buckets.setdefault((bx, by), [])
+                if xy not in bucket:
+                    bucket.append(xy)
+        # a new landmark can cover tiles whose context was already cached
+        self._ctx_cache.clear()
 
     def _lookup_landmark(self, xy):
         if xy is None:
             return None
         x, y = xy
-        for (lx, ly), info in self.landmark_cache.items():
+        best = None
+        for lxy in self._landmark_buckets.get((int(x // LANDMARK_BUCKET), int(y // LANDMARK_BUCKET)), ()):
+            info = self.landmark_cache[lxy]
             r = info["radius"]
-            if abs(lx - x) <= r and abs(ly - y) <= r:
-                return info["name"]
-        return None
+            if abs(lxy[0] - x) <= r and abs(lxy[1] - y) <= r:
+                # earliest registered landmark wins, as with the old linear scan
+                if best is None or self._landmark_order[lxy] < self._landmark_order[best]:
+                    best = lxy
+        return self.landmark_cache[best]["name"] if best is not None else None
 
     # --------------------------------------------------------
     # global / regional lookup
@@ -166,9 +293,9 @@ class MapManager:
 
         # coord lookup: "x,y"
         if coord is not None:
-            key = f"{coord[0]},{coord[1]}"
-            if key in self.map_data:
-                return self.map_data[key]
+            entry = self._map_by_xy.get((coord[0], coord[1]))
+            if entry is not None:
+                return entry
 
         # if nothing found: empty
         return {}
@@ -178,6 +305,23 @@ class MapManager:
         regions = self.map_data.get("regions", {})
         return regions.get(region_key, {})
 
+    def _get_region_info(self, region_key: str) -> RegionInfo:
+        info = self._region_info_cache.get(region_key)
+        if info is None:
+            t = self._get_region_template(region_key)
+            info = RegionInfo(
+                zone_type=t.get("type", "wilderness"),
+                buildings=tuple(dict.fromkeys(t.get("buildings", []))),
+                building_weights=t.get("building_weights", {}),
+                light_pollution=float(t.get("light_pollution", 0.0)),
+                comfort_mod=float(t.get("comfort_mod", 0.0)),
+                noise_mod=float(t.get("noise_mod", 0.0)),
+                safety_mod=float(t.get("safety_mod", 0.0)),
+                landmarks=t.get("landmarks", {}),
+            )
+            self._region_info_cache[region_key] = info
+        return info
+
     def _get_grid_tile(self, coord) -> dict:
         """
         grid.json should be keyed either by "x,y" or by int index.
@@ -185,8 +329,7 @@ class MapManager:
         """
         if coord is None:
             return {}
-        key = f"{coord[0]},{coord[1]}"
-        return self.grid_data.get(key, {})
+        return self._grid_by_xy.get((coord[0], coord[1]), {})
 
     # --------------------------------------------------------
     # public: main context builder
@@ -203,8 +346,50 @@ class MapManager:
           - grid env (humidity, heat_retention, biome, water)
           - building + room comfort
           - light_pollution and landmark
+        Results are cached per (location_id, coord) in a bounded LRU (CTX_CACHE_SIZE);
+        callers get their own copy, nested "coord"/"grid"/"global" values included.
         """
-
+        key = (location_id, tuple(coord) if coord is not None else None)
+        cache = self._ctx_cache
+        cached = cache.pop(key, None)
+        if cached is None:
+            cached = self._build_context_fragment(location_id, coord)
+            if len(cache) >= self.CTX_CACHE_SIZE:
+                # dicts keep insertion order: the first key is the least recently used
+                del cache[next(iter(cache))]
+        # (re)insert at the end so hits stay fresh
+        cache[key] = cached
+        return _copy_ctx(cached)
+
+    def get_context_fragments(self, coords, location_ids=None) -> Dict[str, list]:
+        """
+        Context for many tiles as columns: {field: [value per tile]}, in input order.
+        Tiles are resolved in order (landmark registration carries over as in a loop);
+        fields only some tiles have (e.g. from location overrides) are None elsewhere.
+        """
+        if location_ids is None:
+            tiles = [(None, c) for c in coords]
+        else:
+            tiles = list(zip(location_ids, coords))
+        columns: Dict[str, list] = {}
+        get = self.get_context_fragment
+        for i, (location_id, coord) in enumerate(tiles):
+            for key, value in get(location_id, coord).items():
+                col = columns.get(key)
+                if col is None:
+                    columns[key] = col = [None] * i
+                col.append(value)
+        n = len(tiles)
+        for col in columns.values():
+            if len(col) < n:
+                col.extend([None] * (n - len(col)))
+        return columns
+
+    def _build_context_fragment(
+        self,
+        location_id: Optional[str] = None,
+        coord: Optional[Tuple[int, int]] = None,
+    ) -> dict:
         # 1) figure out coord
         if coord is None:
             # maybe in map file
@@ -224,8 +409,11 @@ class MapManager:
 
         # 4) regional (from default_map.json, per-tile or named)
         regional_entry = self._get_regional_entry(location_id, coord)
-        region_key = regional_entry.get("region", regional_entry.get("zone", "suburb"))
-        region_template = self._get_region_template(region_key)
+        if "region" in regional_entry:
+            region_key = regional_entry["region"]
+        else:
+            region_key = regional_entry.get("zone", "suburb")
+        region = self._get_region_info(region_key)
 
         # 5) local grid info (from grid.json: humidity, heat, noise, water)
         grid_tile = self._get_grid_tile(coord)
@@ -236,7 +424,7 @@ class MapManager:
             "location_id": location_id,
             "coord": [x, y],
             "region": region_key,
-            "zone_type": region_template.get("type", "wilderness"),
+            "zone_type": region.zone_type,
             "name": regional_entry.get("name", ""),
         }
 
@@ -245,13 +433,17 @@ class MapManager:
         # ----------------------------------------------------
         # priority:
         #   map entry -> region template -> fallback
-        region_buildings = region_template.get("buildings", [])
+        region_buildings = region.buildings
         if "building" in regional_entry:
             building_key = regional_entry["building"]
+        elif region.building_weights:
+            building_key = self._weighted_pick(
+                rnd, region.building_weights, default="generic_building", cache_key=("buildings", region_key)
+            )
         elif region_buildings:
-            # make weights: all 1 for now
-            btable = {b: 1 for b in region_buildings}
-            building_key = self._weighted_pick(rnd, btable, default="generic_building")
+            # uniform pick; same roll as an all-ones weighted pick (first i with i + 1 >= r)
+            r = rnd.random() * len(region_buildings)
+            building_key = region_buildings[max(0, math.ceil(r) - 1)]
         else:
             building_key = "generic_building"
 
@@ -274,7 +466,7 @@ class MapManager:
         # 9) light pollution & environment base
         # ----------------------------------------------------
         # from region
-        region_lp = float(region_template.get("light_pollution", 0.0))
+        region_lp = region.light_pollution
         # from grid (e.g. near water, near city)
         grid_lp = float(grid_tile.get("light_pollution", 0.0))
         # from map explicit
@@ -288,7 +480,7 @@ class MapManager:
         landmark = self._lookup_landmark(coord)
         if not landmark:
             # region can define a landmark pool
-            lm_pool = region_template.get("landmarks", {})
+            lm_pool = region.landmarks
             if lm_pool:
                 # roll candidates
                 candidates = []
@@ -317,9 +509,9 @@ class MapManager:
         b_air_mod = float(building_data.get("air_mod", 0.0))
 
         # region-level tweaks (poor/rich/abandoned/etc.)
-        r_comf_mod = float(region_template.get("comfort_mod", 0.0))
-        r_noise_mod = float(region_template.get("noise_mod", 0.0))
-        r_safety_mod = float(region_template.get("safety_mod", 0.0))
+        r_comf_mod = region.comfort_mod
+        r_noise_mod = region.noise_mod
+        r_safety_mod = region.safety_mod
 
         # grid-level influence (noise_pollution, heat_retention, water)
         g_noise = float(grid_tile.get("noise_pollution", 0.0))   # 0..1
@@ -332,24 +524,24 @@ class MapManager:
         comfort += b_comf_mod + r_comf_mod
         comfort -= (g_hum - 0.5) * 0.15          # very humid = slightly less comfy
         comfort += g_water * 0.05                # near large lake/river = tiny bonus
-        comfort = _clamp(comfort)
+        comfort = max(0.0, min(1.0, comfort))
 
         # noise: room + building + region + grid noise
         noise = base_noise
         noise += b_noise_mod + r_noise_mod
         noise += g_noise * 0.4                   # near road/rail/port
-        noise = _clamp(noise)
+        noise = max(0.0, min(1.0, noise))
 
         # air: room + building + grid (heat + water can trap air)
         air_quality = base_air
         air_quality += b_air_mod
         air_quality -= g_heat * 0.1              # urban heat island
         air_quality -= g_noise * 0.05            # pollution proxy
-        air_quality = _clamp(air_quality)
+        air_quality = max(0.0, min(1.0, air_quality))
 
         # safety: region-based first, then noise/weather could tweak later
         safety = 1.0 + r_safety_mod
-        safety = _clamp(safety, 0.0, 1.0)
+        safety = max(0.0, min(1.0, safety))
 
         # ----------------------------------------------------
         # 12) room lighting
@@ -360,16 +552,14 @@ class MapManager:
         else:
             # outdoor or non-lit areas: base on environment
             room_light = light_pollution * 0.5
-        room_light = _clamp(room_light)
+        room_light = max(0.0, min(1.0, room_light))
 
         # ----------------------------------------------------
         # 13) hand-authored location override
         # ----------------------------------------------------
         if location_id:
-            custom_path = os.path.join(self.locations_dir, f"{location_id}.json")
-            if os.path.exists(custom_path):
-                with open(custom_path, "r", encoding="utf-8") as f:
-                    loc_override = json.load(f)
+            loc_override = self.location_overrides.get(location_id)
+            if loc_override is not None:
                 # overrides win
                 ctx.update(loc_override)
                 # but we keep computed values too unless explicitly replaced
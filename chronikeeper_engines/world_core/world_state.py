@@ -3,7 +3,14 @@
 # Central world data container synced with EnvironmentEngine
 # ============================================================
 
-from dataclasses import dataclass, field
+import logging
+from dataclasses import dataclass, field, fields
+
+_LOG = logging.getLogger(__name__)
+
+# prompt/debug templates, parsed once at import
+_DESCRIBE_TIME = "Day {} ({:.1f}h), Month {}, Season: {}".format
+_DESCRIBE_ENV = "T:{:.2f}, H:{:.2f}, C:{:.2f}, AQ:{:.2f}, Vis:{:.2f}".format
 
 @dataclass
 class WorldState:
@@ -26,6 +33,9 @@ class WorldState:
     inventory: list = field(default_factory=lambda: ["watch"])
     flags: dict = field(default_factory=dict)
 
+    # last describe_time() result, keyed by the values it renders (not persisted)
+    _time_desc: tuple = field(default=(None, None), init=False, repr=False, compare=False)
+
     # ========================================================
     # === Environment integration ===
     # ========================================================
@@ -66,19 +76,22 @@ class WorldState:
         t = self.get_time_status()
         if not t:
             return "Time data unavailable"
-        return f"Day {t['day']} ({t['hour']:.1f}h), Month {t['month']}, Season: {self.get_season().capitalize()}"
+        key = (t["day"], t["hour"], t["month"], self.get_season())
+        cached_key, text = self._time_desc
+        if key != cached_key:
+            text = _DESCRIBE_TIME(key[0], key[1], key[2], key[3].capitalize())
+            self._time_desc = (key, text)
+        return text
 
     def describe_environment(self) -> str:
         """Readable short text for prompts or debugging."""
         sig = self.environment_signature or {}
         if not sig:
             return "Environment not initialized"
-        return (
-            f"T:{sig.get('temperature', 0.5):.2f}, "
-            f"H:{sig.get('humidity', 0.5):.2f}, "
-            f"C:{sig.get('comfort', 0.5):.2f}, "
-            f"AQ:{sig.get('air_quality', 0.5):.2f}, "
-            f"Vis:{sig.get('visibility', 0.5):.2f}"
+        get = sig.get
+        return _DESCRIBE_ENV(
+            get("temperature", 0.5), get("humidity", 0.5), get("comfort", 0.5),
+            get("air_quality", 0.5), get("visibility", 0.5),
         )
 
     def set_location(self, location_id: str):
@@ -108,7 +121,17 @@ class WorldState:
     def from_dict(cls, data: dict, environment_engine=None):
         """Recreate a world state from saved JSON/dict."""
         ws = cls(environment_engine=environment_engine)
+        allowed = _FIELD_NAMES if cls is WorldState else {f.name for f in fields(cls) if f.init}
+        unknown = []
         for k, v in data.items():
-            if hasattr(ws, k):
+            if k in allowed:
                 setattr(ws, k, v)
+            else:
+                unknown.append(k)
+        if unknown:
+            _LOG.warning("WorldState.from_dict: ignoring unknown keys %s", unknown)
         return ws
+
+
+# persisted/constructor fields that from_dict may restore
+_FIELD_NAMES = frozenset(f.name for f in fields(WorldState) if f.init)